@@ -6,9 +6,20 @@ This script measures cache performance for different schema access patterns
 to identify bottlenecks and validate optimizations.
 """
 
+from __future__ import annotations
+
+import gc
 import json
 import statistics
+import tempfile
 import time
+import timeit
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
 
 from teds_core.cache import TedsSchemaCache
@@ -18,13 +29,154 @@ from teds_core.refs import (
     resolve_schema_node,
 )
 
+try:
+    import orjson
+except ImportError:  # Optional: faster result dumps when available
+    orjson = None
+
+
+@dataclass(slots=True)
+class Stats:
+    """Summary statistics of one benchmark metric, in milliseconds."""
+
+    mean: float
+    median: float
+    stdev: float
+    min: float
+    max: float
+
+    @classmethod
+    def from_times(cls, times: Sequence[float]) -> Stats:
+        """Summarize nanosecond samples."""
+        scaled = sorted(t / 1e6 for t in times)  # ms, ordered once
+        sd = statistics.stdev(scaled) if len(scaled) > 1 else 0.0
+        return cls(
+            mean=statistics.fmean(scaled),
+            median=statistics.median(scaled),
+            stdev=sd,
+            min=scaled[0],
+            max=scaled[-1],
+        )
+
+
+def save_results(results: dict, results_file: Path) -> None:
+    """Write benchmark results as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        results_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(results_file, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Collect garbage, then keep the cyclic GC off for the enclosed block.
+
+    Mirrors what ``timeit`` does around its timing loop, so hand-rolled loops
+    don't pick up collector pauses in the middle of a sample.
+    """
+    gc.collect()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def measure(
+    call: Callable[[], object],
+    iterations: int,
+    setup: Callable[[], object] | None = None,
+) -> array:
+    """Time ``call()`` ``iterations`` times and return per-call nanoseconds.
+
+    ``setup`` runs untimed before every call. The clock is bound to a local,
+    samples go into a preallocated ``array('q')`` and the cyclic GC is paused
+    for the whole run, keeping the interpreter work around each sample to a
+    minimum.
+    """
+    now = time.perf_counter_ns
+    samples = array("q", bytes(8 * iterations))
+    with gc_paused():
+        for i in range(iterations):
+            if setup is not None:
+                setup()
+            start = now()
+            call()
+            samples[i] = now() - start
+    return samples
+
+
+def sample_per_call(
+    stmt: Callable[[], object] | str,
+    setup: Callable[[], object] | str | None = None,
+    repeat: int = 10,
+) -> list[float]:
+    """Time ``stmt`` in ``repeat`` blocks and return per-call durations in ns.
+
+    ``timeit.Timer.autorange`` picks how many calls go into each block, so
+    the timer overhead is amortized instead of charged to every call. Blocks
+    are timed in float seconds (autorange's 0.2s target relies on that) and
+    converted to nanoseconds to match the ``perf_counter_ns`` samples.
+    """
+    timer = timeit.Timer(stmt, setup or "pass")
+    number, _ = timer.autorange()
+    blocks = timer.repeat(repeat=repeat, number=number)
+    return [total * 1e9 / number for total in blocks]
+
+
+def warm_up(demo: Path, ref: str, rounds: int = 3) -> None:
+    """Run untimed cold resolves so first-call costs stay out of the samples.
+
+    Lazy imports, format-checker setup and similar one-off work land here;
+    nothing measured in this function is included in any reported result.
+    """
+    with tempfile.TemporaryDirectory() as root, TedsSchemaCache(root) as cache:
+        for _ in range(rounds):
+            cache.clear()
+            resolve_schema_node(demo, ref, cache)
+            build_validator_for_ref(demo, ref, cache)
+            collect_examples(demo, ref, cache)
+
+
+def _bench_one_pointer(
+    task: tuple[Path, str, str, int],
+) -> tuple[str, dict[str, float]]:
+    """Measure cold-miss resolution of a single pointer (process pool worker).
+
+    Each worker keeps its cache file in a private temporary directory so
+    concurrent workers never write to the same cache file.
+    """
+    demo, pointer, ref, iterations = task
+    warm_up(demo, ref)  # Fresh worker process: absorb first-call costs
+
+    # One cache for the whole run: only the cold miss is of interest, so
+    # clearing is enough and no context enter/exit lands between samples.
+    with tempfile.TemporaryDirectory() as root, TedsSchemaCache(root) as cache:
+        durations = measure(
+            lambda: resolve_schema_node(demo, ref, cache),
+            iterations,
+            setup=cache.clear,  # Force cache miss each time
+        )
+
+    return pointer, asdict(Stats.from_times(durations))
+
+
+class BenchmarkSetup:
+    """Demo schemas and refs shared by the cache benchmark classes."""
 
-class CacheBenchmark:
     def __init__(self):
         self.demo_dir = Path(__file__).parent / "demo"
         self.sample_schema = self.demo_dir / "sample_schemas.yaml"
         self.public_schema = self.demo_dir / "public_schemas.yaml"
 
+        # Read the schema files once up front so they sit in the OS page cache:
+        # the benchmarks measure in-memory cache behavior, not cold disk I/O.
+        for schema_file in (self.sample_schema, self.public_schema):
+            schema_file.read_bytes()
+
         # Common schema pointers to test
         self.test_pointers = [
             "#/components/schemas/User",
@@ -34,189 +186,135 @@ class CacheBenchmark:
             "#/components/schemas/Contact",
             "#/components/schemas/OrderLine",
         ]
+        # Fully assembled refs, built once so timed regions don't pay for them
+        self.refs = [f"sample_schemas.yaml{p}" for p in self.test_pointers]
 
         self.results = {}
 
-    def time_operation(self, operation_name: str, func, *args, **kwargs) -> float:
-        """Time a single operation and return duration in seconds."""
-        start = time.perf_counter()
-        _ = func(*args, **kwargs)  # Execute function, ignore result
-        end = time.perf_counter()
-        duration = end - start
-        print(f"  {operation_name}: {duration*1000:.2f}ms")
-        return duration
-
-    def benchmark_current_cache(self, iterations: int = 100) -> dict[str, float]:
-        """Benchmark current cache implementation."""
-        print(
-            f"\n=== Current Cache Implementation Benchmark ({iterations} iterations) ==="
-        )
 
-        # Clear cache first
+class CacheBenchmark(BenchmarkSetup):
+    def benchmark_current_cache(
+        self, repeat: int = 10, iterations: int = 100
+    ) -> dict[str, float]:
+        """Benchmark current cache implementation.
+
+        Warm metrics are sampled in ``repeat`` autoranged blocks. Cold metrics
+        need an empty cache before every call, so they take ``iterations``
+        single-call samples with ``measure()``, whose untimed setup does the
+        ``clear()``; as in older result files, clear cost is not included.
+        """
+        print(f"\n=== Current Cache Implementation Benchmark ({repeat} repeats) ===")
+        demo, ref = self.demo_dir, self.refs[0]
+        warm_up(demo, ref)
+
+        durations = {}
+
+        # One cache serves every metric: cold metrics clear it in untimed
+        # setup, warm metrics prime it in setup.
         with TedsSchemaCache() as cache:
             cache.clear()
 
-        durations = {
-            "cold_start": [],
-            "warm_cache": [],
-            "validator_build": [],
-            "examples_collect": [],
-        }
-
-        for i in range(iterations):
-            if i % 20 == 0:
-                print(f"Iteration {i+1}/{iterations}")
-
-            # Test cold start (cache miss)
-            with TedsSchemaCache() as cache:
-                cache.clear()
-                start = time.perf_counter()
-                schema, _ = resolve_schema_node(
-                    self.demo_dir, f"sample_schemas.yaml{self.test_pointers[0]}", cache
-                )
-                end = time.perf_counter()
-                durations["cold_start"].append(end - start)
+            # Test cold start (cache miss): every call starts from an empty cache
+            durations["cold_start"] = measure(
+                partial(resolve_schema_node, demo, ref, cache),
+                iterations,
+                setup=cache.clear,
+            )
 
             # Test warm cache (cache hit)
-            with TedsSchemaCache() as cache:
-                # Warm up cache
-                resolve_schema_node(
-                    self.demo_dir, f"sample_schemas.yaml{self.test_pointers[0]}", cache
-                )
-
-                # Measure warm access
-                start = time.perf_counter()
-                schema, _ = resolve_schema_node(
-                    self.demo_dir, f"sample_schemas.yaml{self.test_pointers[0]}", cache
-                )
-                end = time.perf_counter()
-                durations["warm_cache"].append(end - start)
+            def prime_cache():
+                resolve_schema_node(demo, ref, cache)
+
+            durations["warm_cache"] = sample_per_call(
+                lambda: resolve_schema_node(demo, ref, cache),
+                setup=prime_cache,
+                repeat=repeat,
+            )
 
             # Test validator building
-            with TedsSchemaCache() as cache:
-                start = time.perf_counter()
-                build_validator_for_ref(
-                    self.demo_dir, f"sample_schemas.yaml{self.test_pointers[0]}", cache
-                )
-                end = time.perf_counter()
-                durations["validator_build"].append(end - start)
+            durations["validator_build"] = measure(
+                partial(build_validator_for_ref, demo, ref, cache),
+                iterations,
+                setup=cache.clear,
+            )
+
+            # Test validator building again on the warm cache (real-world reuse)
+            durations["validator_build_warm"] = sample_per_call(
+                lambda: build_validator_for_ref(demo, ref, cache),
+                setup=lambda: build_validator_for_ref(demo, ref, cache),
+                repeat=repeat,
+            )
 
             # Test examples collection
-            with TedsSchemaCache() as cache:
-                start = time.perf_counter()
-                collect_examples(
-                    self.demo_dir, f"sample_schemas.yaml{self.test_pointers[0]}", cache
-                )
-                end = time.perf_counter()
-                durations["examples_collect"].append(end - start)
+            durations["examples_collect"] = measure(
+                partial(collect_examples, demo, ref, cache),
+                iterations,
+                setup=cache.clear,
+            )
+
+            # Test examples collection again on the warm cache
+            durations["examples_collect_warm"] = sample_per_call(
+                lambda: collect_examples(demo, ref, cache),
+                setup=prime_cache,
+                repeat=repeat,
+            )
 
         # Calculate statistics
-        stats = {}
-        for operation, times in durations.items():
-            stats[operation] = {
-                "mean": statistics.mean(times) * 1000,  # Convert to ms
-                "median": statistics.median(times) * 1000,
-                "stdev": statistics.stdev(times) * 1000 if len(times) > 1 else 0,
-                "min": min(times) * 1000,
-                "max": max(times) * 1000,
-            }
-
-        return stats
+        return {
+            operation: asdict(Stats.from_times(times))
+            for operation, times in durations.items()
+        }
 
     def benchmark_multiple_pointers(
-        self, iterations: int = 50
+        self, iterations: int = 50, workers: int | None = None
     ) -> dict[str, dict[str, float]]:
-        """Benchmark accessing multiple different pointers."""
+        """Benchmark accessing multiple different pointers.
+
+        Pointers share no state, so each one is measured in its own worker
+        process; ``workers`` caps the pool size (default: CPU count).
+        """
         print(f"\n=== Multiple Pointers Benchmark ({iterations} iterations) ===")
 
-        results = {}
-
-        for pointer in self.test_pointers:
-            print(f"Testing pointer: {pointer}")
-            durations = []
-
-            for _ in range(iterations):
-                with TedsSchemaCache() as cache:
-                    cache.clear()  # Force cache miss each time
-                    start = time.perf_counter()
-                    schema, _ = resolve_schema_node(
-                        self.demo_dir, f"sample_schemas.yaml{pointer}", cache
-                    )
-                    end = time.perf_counter()
-                    durations.append(end - start)
-
-            results[pointer] = {
-                "mean": statistics.mean(durations) * 1000,
-                "median": statistics.median(durations) * 1000,
-                "stdev": statistics.stdev(durations) * 1000
-                if len(durations) > 1
-                else 0,
-                "min": min(durations) * 1000,
-                "max": max(durations) * 1000,
-            }
+        tasks = [
+            (self.demo_dir, pointer, ref, iterations)
+            for pointer, ref in zip(self.test_pointers, self.refs, strict=True)
+        ]
+        print(f"Testing {len(tasks)} pointers: {', '.join(self.test_pointers)}")
 
-        return results
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return dict(pool.map(_bench_one_pointer, tasks))
 
     def benchmark_cache_overhead(
         self, iterations: int = 100
     ) -> dict[str, dict[str, float]]:
         """Compare cached vs non-cached operations."""
         print(f"\n=== Cache Overhead Benchmark ({iterations} iterations) ===")
+        demo, ref = self.demo_dir, self.refs[0]
+        warm_up(demo, ref)
 
         # Without cache
-        no_cache_times = []
-        for _ in range(iterations):
-            start = time.perf_counter()
-            schema, _ = resolve_schema_node(
-                self.demo_dir, f"sample_schemas.yaml{self.test_pointers[0]}", None
-            )
-            end = time.perf_counter()
-            no_cache_times.append(end - start)
-
-        # With cache (cold)
-        cold_cache_times = []
-        for _ in range(iterations):
-            with TedsSchemaCache() as cache:
-                cache.clear()
-                start = time.perf_counter()
-                schema, _ = resolve_schema_node(
-                    self.demo_dir, f"sample_schemas.yaml{self.test_pointers[0]}", cache
-                )
-                end = time.perf_counter()
-                cold_cache_times.append(end - start)
-
-        # With cache (warm)
-        warm_cache_times = []
+        no_cache_times = measure(
+            lambda: resolve_schema_node(demo, ref, None), iterations
+        )
+
         with TedsSchemaCache() as cache:
-            # Warm up
-            resolve_schema_node(
-                self.demo_dir, f"sample_schemas.yaml{self.test_pointers[0]}", cache
+            # With cache (cold)
+            cold_cache_times = measure(
+                lambda: resolve_schema_node(demo, ref, cache),
+                iterations,
+                setup=cache.clear,
             )
 
-            for _ in range(iterations):
-                start = time.perf_counter()
-                schema, _ = resolve_schema_node(
-                    self.demo_dir, f"sample_schemas.yaml{self.test_pointers[0]}", cache
-                )
-                end = time.perf_counter()
-                warm_cache_times.append(end - start)
+            # With cache (warm)
+            resolve_schema_node(demo, ref, cache)  # Warm up
+            warm_cache_times = measure(
+                lambda: resolve_schema_node(demo, ref, cache), iterations
+            )
 
         return {
-            "no_cache": {
-                "mean": statistics.mean(no_cache_times) * 1000,
-                "median": statistics.median(no_cache_times) * 1000,
-                "stdev": statistics.stdev(no_cache_times) * 1000,
-            },
-            "cold_cache": {
-                "mean": statistics.mean(cold_cache_times) * 1000,
-                "median": statistics.median(cold_cache_times) * 1000,
-                "stdev": statistics.stdev(cold_cache_times) * 1000,
-            },
-            "warm_cache": {
-                "mean": statistics.mean(warm_cache_times) * 1000,
-                "median": statistics.median(warm_cache_times) * 1000,
-                "stdev": statistics.stdev(warm_cache_times) * 1000,
-            },
+            "no_cache": asdict(Stats.from_times(no_cache_times)),
+            "cold_cache": asdict(Stats.from_times(cold_cache_times)),
+            "warm_cache": asdict(Stats.from_times(warm_cache_times)),
         }
 
     def run_full_benchmark(self) -> dict:
@@ -241,7 +339,7 @@ class CacheBenchmark:
         print("\n🔥 Current Cache Performance:")
         for operation, stats in results["current_cache"].items():
             print(
-                f"  {operation:20} | Mean: {stats['mean']:6.2f}ms | Median: {stats['median']:6.2f}ms | StdDev: {stats['stdev']:6.2f}ms"
+                f"  {operation:22} | Mean: {stats['mean']:6.2f}ms | Median: {stats['median']:6.2f}ms | StdDev: {stats['stdev']:6.2f}ms"
             )
 
         print("\n🎯 Multiple Pointers Performance:")
@@ -273,8 +371,7 @@ def main():
 
     # Save results to file
     results_file = Path(__file__).parent / "benchmark_results_current.json"
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2)
+    save_results(results, results_file)
     print(f"\n💾 Results saved to: {results_file}")
 
 
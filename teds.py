@@ -4,16 +4,23 @@
 Allows running `python teds.py` in the repo. Installed entry-point is `teds`.
 """
 
-from teds_core import (
-    __version__,
-    generate_from,
-    validate_doc,
-    validate_file,
-    yaml_dumper,
-    yaml_loader,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import teds_core
 from teds_core.cli import main
 
+if TYPE_CHECKING:
+    from teds_core import (
+        __version__,
+        generate_from,
+        validate_doc,
+        validate_file,
+        yaml_dumper,
+        yaml_loader,
+    )
+
 __all__ = [
     "__version__",
     "generate_from",
@@ -24,5 +31,14 @@ __all__ = [
     "yaml_loader",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    # Re-exports resolve through teds_core's lazy attributes, so running the CLI
+    # through this shim doesn't import validate/generate up front.
+    if name in __all__:
+        return getattr(teds_core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":  # pragma: no cover
     main()  # pragma: no cover
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from .generate import generate_from
-from .validate import validate_doc, validate_file
-from .version import get_version
-from .yamlio import yaml_dumper, yaml_loader
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__version__ = get_version()
+if TYPE_CHECKING:
+    from .generate import generate_from
+    from .validate import validate_doc, validate_file
+    from .yamlio import yaml_dumper, yaml_loader
+
+    __version__: str
+
+# Public names are imported from their submodule on first access (PEP 562), so
+# `import teds_core` or importing a single submodule stays cheap.
+_LAZY_ATTRS = {
+    "generate_from": "generate",
+    "validate_doc": "validate",
+    "validate_file": "validate",
+    "yaml_dumper": "yamlio",
+    "yaml_loader": "yamlio",
+}
 
 __all__ = [
     "__version__",
@@ -15,3 +28,20 @@ __all__ = [
     "yaml_dumper",
     "yaml_loader",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from .version import get_version
+
+        value: Any = get_version()
+    elif name in _LAZY_ATTRS:
+        value = getattr(import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
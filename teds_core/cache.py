@@ -4,88 +4,262 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from ruamel.yaml import YAML
+
 from .errors import TedsError
-from .yamlio import yaml_loader
+from .yamlio import make_yaml_loader, yaml_loader
+
+try:
+    import orjson
+except ImportError:  # Optional: much faster cache load/save when installed
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # Optional: much faster content fingerprints when installed
+    xxhash = None
+
+_MISSING = object()
+_ROOT_POINTERS = frozenset({"#/", "#", ""})
+
+# Files are hashed in chunks of this size, so memory stays bounded for large files
+_HASH_CHUNK_SIZE = 1 << 20
 
 
 class SchemaCacheError(TedsError):
     """Schema cache related errors."""
 
 
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a "Z" suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse the cache file, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _orjson_default(obj: Any) -> Any:
+    # Subclasses of builtin types are passed through to here: orjson reads an
+    # OrderedDict's storage order, which ignores move_to_end(), while dict()
+    # iterates in LRU order
+    for base in (dict, list, str, int, float):
+        if isinstance(obj, base):
+            return base(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize the cache as compact UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS,
+        )
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def _parse_pointer(json_pointer: str) -> tuple[str, ...]:
+    """Split a JSON pointer into its unescaped reference tokens.
+
+    The same pointers are resolved over and over during a run, so the parsed
+    tokens are memoized.
+    """
+    # Remove leading # and /
+    pointer = json_pointer.lstrip("#/")
+    if not pointer:
+        return ()
+    if "~" not in pointer:
+        return tuple(pointer.split("/"))
+    # JSON Pointer unescaping: ~1 -> /, ~0 -> ~ (in this order, see RFC 6901)
+    return tuple(
+        part.replace("~1", "/").replace("~0", "~") if "~" in part else part
+        for part in pointer.split("/")
+    )
+
+
 class TedsSchemaCache:
     """Persistent cache for schema files and JSON pointer references.
 
     Cache structure:
     {
-        "cache_version": "1.0",
+        "cache_version": "6.0",
         "created": "2025-09-30T10:30:00Z",
         "last_updated": "2025-09-30T14:22:15Z",
         "entries": {
-            "sha256_hash": {
+            "dev:inode:mtime_ns:size": {
                 "file_path": "/absolute/path/to/schema.yaml",
                 "file_size": 2048,
-                "last_modified": "2025-09-30T14:20:00Z",
+                "last_modified_ns": 1759242000000000000,
+                "content_hash": "9f3c1e0a5b7d2c48",
                 "pointers": {
-                    "#/components/schemas/User": {
-                        "schema": {...},
-                        "cached_at": "2025-09-30T14:22:15Z",
-                        "dependencies": ["#/components/schemas/Address"]
-                    }
+                    "#/components/schemas/User": {...},
+                    "#/components/schemas/Admin": null
+                },
+                "cached_at": {
+                    "#/components/schemas/User": "2025-09-30T14:22:15Z",
+                    "#/components/schemas/Admin": "2025-09-30T14:22:15Z"
+                },
+                "aliases": {
+                    "#/components/schemas/Admin": "#/components/schemas/User"
                 }
             }
         }
     }
+
+    "pointers" and "cached_at" are parallel maps, so a cached pointer costs one
+    dict slot in each rather than a wrapper object of its own. A pointer to an
+    object shared with an earlier pointer (a YAML alias) is listed in "aliases"
+    and stores no schema of its own. Each file keeps
+    at most MAX_POINTERS_PER_FILE pointers, ordered from least
+    to most recently used; the least recently used ones are evicted first.
     """
 
-    CACHE_VERSION = "1.0"
+    CACHE_VERSION = "6.0"
     CACHE_FILENAME = ".teds-schema-cache.json"
+    JOURNAL_FILENAME = ".teds-schema-cache.log"
+    MAX_POINTERS_PER_FILE = 512
+
+    def __init__(self, project_root: str | Path = ".", durable: bool = False):
+        """Initialize cache with project root directory.
 
-    def __init__(self, project_root: str | Path = "."):
-        """Initialize cache with project root directory."""
+        Args:
+            project_root: Directory holding the cache file
+            durable: Write the cache via a temporary file and atomic rename.
+                The cache can always be rebuilt, so by default it is written
+                in place.
+        """
         self.project_root = Path(project_root).resolve()
         self.cache_file = self.project_root / self.CACHE_FILENAME
+        self.journal_file = self.project_root / self.JOURNAL_FILENAME
+        self.durable = durable
         self.cache_data: dict[str, Any] = {}
         self.dirty = False
+        # Changes since load(), appended to the journal on save()
+        self._pending_ops: list[list[Any]] = []
+        # Set when the snapshot must be rewritten instead of journaling
+        self._compact = False
+        self._snapshot_size = 0
+        self._journal_size = 0
+        # Record/op counts behind the cheap compaction check in save()
+        self._snapshot_records = 0
+        self._journal_ops = 0
+        # path -> (mtime_ns, size, hash): skips rehashing files that did not change
+        self._meta_cache: dict[Path, tuple[int, int, str]] = {}
+        self._resolved: dict[str | Path, Path] = {}
+        self._path_strs: dict[Path, str] = {}
+        # path -> ((mtime_ns, size), document, pointer index, aliases)
+        self._parsed_docs: dict[Path, tuple[tuple[int, int], Any, dict, dict]] = {}
+        # Guards _parsed_docs writes from prime()'s worker threads
+        self._lock = threading.Lock()
 
     def load(self) -> None:
-        """Load cache from disk."""
+        """Load cache from disk: the snapshot, then the journal replayed on top."""
+        self._pending_ops = []
+        self._compact = False
         if self.cache_file.exists():
             try:
-                with open(self.cache_file, encoding="utf-8") as f:
-                    self.cache_data = json.load(f)
+                snapshot = self.cache_file.read_bytes()
+                self.cache_data = _json_loads(snapshot)
 
                 # Validate cache version
                 if self.cache_data.get("cache_version") != self.CACHE_VERSION:
                     self._init_empty_cache()
-                    self.dirty = True
-
-            except (json.JSONDecodeError, OSError):
+                    self._rewrite_snapshot()
+                else:
+                    self._snapshot_size = len(snapshot)
+                    self._snapshot_records = self._count_records()
+                    self._replay_journal()
+                    # Pointer maps are LRU ordered: least recently used first
+                    for entry in self.cache_data.get("entries", {}).values():
+                        entry["pointers"] = OrderedDict(entry.get("pointers", {}))
+                        entry.setdefault("cached_at", {})
+                        entry.setdefault("aliases", {})
+                        if isinstance(entry.get("file_path"), str):
+                            entry["file_path"] = sys.intern(entry["file_path"])
+
+            except (ValueError, OSError):  # JSONDecodeError is a ValueError
                 # Corrupted cache file - reinitialize
                 self._init_empty_cache()
-                self.dirty = True
+                self._rewrite_snapshot()
         else:
             self._init_empty_cache()
-            self.dirty = True
+            self._rewrite_snapshot()
 
     def save(self) -> None:
-        """Save cache to disk if dirty."""
-        if self.dirty:
-            self.cache_data["last_updated"] = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
-            try:
+        """Save cache to disk if dirty.
+
+        Changes made since load() are appended to the journal, so a save costs
+        O(new entries) rather than O(cache size). The snapshot is rewritten and
+        the journal removed (compaction) once the journal grows past twice the
+        snapshot size, after clear(), or when there is no usable snapshot.
+        Compaction is first decided from op and record counts, so the journal
+        is only encoded when it is likely to be appended.
+        """
+        if not self.dirty:
+            return
+
+        now = _utc_timestamp()
+        self.cache_data["last_updated"] = now
+        try:
+            if not self._compact:
+                self._log("updated", now)
+                # A journal op is about the size of a snapshot record (an entry
+                # or one of its pointers), so counts predict the byte check
+                ops = self._journal_ops + len(self._pending_ops)
+                if ops <= 2 * self._snapshot_records:
+                    journal = b"".join(
+                        _json_dumps(op) + b"\n" for op in self._pending_ops
+                    )
+                    if self._journal_size + len(journal) <= 2 * self._snapshot_size:
+                        with open(self.journal_file, "ab") as f:
+                            f.write(journal)
+                            if self.durable:
+                                f.flush()
+                                os.fsync(f.fileno())
+                        self._journal_size += len(journal)
+                        self._journal_ops = ops
+                        self._pending_ops = []
+                        self.dirty = False
+                        return
+
+            # Drop the journal first: an interrupted compaction then leaves the
+            # previous snapshot, never a journal replayed onto a newer one
+            self.journal_file.unlink(missing_ok=True)
+            data = _json_dumps(self.cache_data)
+            if self.durable:
                 # Atomic write using temporary file
                 temp_file = self.cache_file.with_suffix(".tmp")
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    json.dump(self.cache_data, f, indent=2, ensure_ascii=False)
+                temp_file.write_bytes(data)
                 temp_file.replace(self.cache_file)
-                self.dirty = False
-            except OSError as e:
-                raise SchemaCacheError(f"Failed to save cache: {e}") from e
+            else:
+                self.cache_file.write_bytes(data)
+            self._snapshot_size = len(data)
+            self._snapshot_records = self._count_records()
+            self._journal_size = 0
+            self._journal_ops = 0
+            self._pending_ops = []
+            self._compact = False
+            self.dirty = False
+        except OSError as e:
+            raise SchemaCacheError(f"Failed to save cache: {e}") from e
 
     def get_schema(
         self, file_path: str | Path, json_pointer: str = "#/"
@@ -104,33 +278,98 @@ class TedsSchemaCache:
         """
         abs_path = self._resolve_path(file_path)
 
-        if not abs_path.exists():
-            raise SchemaCacheError(f"Schema file not found: {abs_path}")
+        # The only stat() of the call: it replaces an exists() check and is
+        # passed down for hashing, validation and entry metadata
+        try:
+            stat = abs_path.stat()
+        except OSError as e:
+            raise SchemaCacheError(f"Schema file not found: {abs_path}") from e
 
-        file_hash = self._compute_file_hash(abs_path)
+        file_key = self._fingerprint(stat)
+        if file_key not in self.cache_data.get("entries", {}):
+            self._adopt_entry(file_key, abs_path, stat)
 
         # Check if cache entry is valid
-        if self._is_cache_valid(file_hash, abs_path, json_pointer):
-            return self.cache_data["entries"][file_hash]["pointers"][json_pointer][
-                "schema"
-            ]
+        if self._is_cache_valid(file_key, abs_path, json_pointer, stat):
+            entry = self.cache_data["entries"][file_key]
+            pointers = entry["pointers"]
+            pointers.move_to_end(json_pointer)
+            target = entry["aliases"].get(json_pointer)
+            if target is None:
+                return pointers[json_pointer]
+            # Alias of a shared object: resolve unless the target was evicted
+            if target in pointers:
+                pointers.move_to_end(target)
+                return pointers[target]
 
         # Cache miss - load and cache the schema
-        return self._load_and_cache_schema(abs_path, file_hash, json_pointer)
+        return self._load_and_cache_schema(abs_path, file_key, json_pointer, stat)
 
     def invalidate_file(self, file_path: str | Path) -> None:
         """Invalidate all cache entries for a file."""
         abs_path = self._resolve_path(file_path)
-        file_hash = self._compute_file_hash(abs_path)
+        try:
+            file_key = self._fingerprint(abs_path.stat())
+        except OSError as e:
+            raise SchemaCacheError(f"File not found: {abs_path}") from e
+
+        self._parsed_docs.pop(abs_path, None)
+        if file_key in self.cache_data.get("entries", {}):
+            del self.cache_data["entries"][file_key]
+            self._log("drop", file_key)
+            self.dirty = True
 
-        if file_hash in self.cache_data.get("entries", {}):
-            del self.cache_data["entries"][file_hash]
+    def drain_changes(self) -> list[list[Any]]:
+        """Return and forget the changes recorded since load() or the last drain.
+
+        Lets a cache that is never saved itself, such as one in a worker
+        process, hand its changes to another instance via merge_changes().
+        """
+        ops, self._pending_ops = self._pending_ops, []
+        return ops
+
+    def merge_changes(self, ops: Iterable[list[Any]]) -> None:
+        """Apply changes drained from another instance and keep them for save()."""
+        entries = self.cache_data.setdefault("entries", {})
+        for op in ops:
+            self._apply_op(entries, op)
+            self._log(*op)
             self.dirty = True
 
+    def prime(self, file_paths: Iterable[str | Path]) -> None:
+        """Parse several schema files in parallel ahead of their first use.
+
+        Reading is I/O bound and releases the GIL, so a cold run touching
+        many files does not load them strictly one after another. Files that
+        are already cached are skipped. This is best effort: a file that
+        cannot be read or parsed reports its error on get_schema() instead.
+        """
+        entries = self.cache_data.get("entries", {})
+        pending: dict[Path, os.stat_result] = {}
+        for file_path in file_paths:
+            abs_path = self._resolve_path(file_path)
+            try:
+                stat = abs_path.stat()
+            except OSError:
+                continue
+            if self._fingerprint(stat) not in entries:
+                pending[abs_path] = stat
+        if len(pending) < 2:
+            return
+
+        def parse(item: tuple[Path, os.stat_result]) -> None:
+            with suppress(Exception):
+                self._parse_document(*item, loader=make_yaml_loader())
+
+        workers = min(8, os.cpu_count() or 1, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(parse, pending.items()))
+
     def clear(self) -> None:
         """Clear entire cache."""
+        self._parsed_docs.clear()
         self._init_empty_cache()
-        self.dirty = True
+        self._rewrite_snapshot()
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
@@ -140,8 +379,9 @@ class TedsSchemaCache:
         )
 
         cache_size = 0
-        if self.cache_file.exists():
-            cache_size = self.cache_file.stat().st_size
+        for path in (self.cache_file, self.journal_file):
+            if path.exists():
+                cache_size += path.stat().st_size
 
         return {
             "cache_file": str(self.cache_file),
@@ -163,9 +403,109 @@ class TedsSchemaCache:
         """Context manager exit - save if dirty."""
         self.save()
 
+    def _rewrite_snapshot(self) -> None:
+        """Mark the whole cache to be written as a fresh snapshot on save()."""
+        self._pending_ops = []
+        self._compact = True
+        self.dirty = True
+
+    def _log(self, *op: Any) -> None:
+        """Record a change for the journal and for drain_changes().
+
+        Changes are recorded even when the next save() compacts, so a cache
+        without a snapshot can still hand them on.
+        """
+        self._pending_ops.append(list(op))
+
+    def _set_pointer(
+        self, file_key: str, pointer: str, schema: Any, cached_at: str
+    ) -> None:
+        """Store a pointer in an entry and record it for the journal."""
+        entry = self.cache_data["entries"][file_key]
+        entry["pointers"][pointer] = schema
+        entry["cached_at"][pointer] = cached_at
+        entry["aliases"].pop(pointer, None)
+        self._log("set", file_key, pointer, schema, cached_at)
+
+    def _set_alias(
+        self, file_key: str, pointer: str, target: str, cached_at: str
+    ) -> None:
+        """Store a pointer that shares the schema of ``target`` in an entry."""
+        entry = self.cache_data["entries"][file_key]
+        entry["pointers"][pointer] = None
+        entry["cached_at"][pointer] = cached_at
+        entry["aliases"][pointer] = target
+        self._log("alias", file_key, pointer, target, cached_at)
+
+    def _replay_journal(self) -> None:
+        """Apply the journal written by earlier saves to the loaded snapshot."""
+        try:
+            journal = self.journal_file.read_bytes()
+        except FileNotFoundError:
+            self._journal_size = 0
+            self._journal_ops = 0
+            return
+        self._journal_size = len(journal)
+        lines = journal.splitlines()
+        self._journal_ops = len(lines)
+
+        entries = self.cache_data.setdefault("entries", {})
+        for line in lines:
+            try:
+                op = _json_loads(line)
+            except ValueError:
+                # Torn write of an interrupted save: keep what was read so far
+                self._rewrite_snapshot()
+                return
+            self._apply_op(entries, op)
+
+    def _count_records(self) -> int:
+        """Count the snapshot's records: each entry plus each of its pointers."""
+        entries = self.cache_data.get("entries", {}).values()
+        return sum(1 + len(entry.get("pointers", ())) for entry in entries)
+
+    def _apply_op(self, entries: dict[str, Any], op: list[Any]) -> None:
+        """Apply one journal operation to the entries map."""
+        kind, *args = op
+        if kind == "set":
+            file_key, pointer, schema, cached_at = args
+            if file_key in entries:
+                entries[file_key]["pointers"][pointer] = schema
+                entries[file_key]["cached_at"][pointer] = cached_at
+                entries[file_key]["aliases"].pop(pointer, None)
+        elif kind == "alias":
+            file_key, pointer, target, cached_at = args
+            if file_key in entries:
+                entries[file_key]["pointers"][pointer] = None
+                entries[file_key]["cached_at"][pointer] = cached_at
+                entries[file_key]["aliases"][pointer] = target
+        elif kind == "evict":
+            file_key, pointer = args
+            if file_key in entries:
+                entries[file_key]["pointers"].pop(pointer, None)
+                entries[file_key]["cached_at"].pop(pointer, None)
+                entries[file_key]["aliases"].pop(pointer, None)
+        elif kind == "entry":
+            file_key, metadata = args
+            entries[file_key] = {
+                **metadata,
+                "pointers": OrderedDict(),
+                "cached_at": {},
+                "aliases": {},
+            }
+        elif kind == "drop":
+            entries.pop(args[0], None)
+        elif kind == "rekey":
+            old_key, file_key, mtime_ns = args
+            if old_key in entries:
+                entry = entries[file_key] = entries.pop(old_key)
+                entry["last_modified_ns"] = mtime_ns
+        elif kind == "updated":
+            self.cache_data["last_updated"] = args[0]
+
     def _init_empty_cache(self) -> None:
         """Initialize empty cache structure."""
-        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        now = _utc_timestamp()
         self.cache_data = {
             "cache_version": self.CACHE_VERSION,
             "created": now,
@@ -174,49 +514,133 @@ class TedsSchemaCache:
         }
 
     def _resolve_path(self, file_path: str | Path) -> Path:
-        """Resolve file path to absolute path."""
-        path = Path(file_path)
-        if path.is_absolute():
-            return path.resolve()
+        """Resolve file path to absolute path.
+
+        Resolution walks every path component, so results are memoized for
+        the lifetime of this cache instance.
+        """
+        resolved = self._resolved.get(file_path)
+        if resolved is None:
+            path = Path(file_path)
+            if path.is_absolute():
+                resolved = path.resolve()
+            else:
+                resolved = (self.project_root / path).resolve()
+            self._resolved[file_path] = resolved
+        return resolved
+
+    @staticmethod
+    def _fingerprint(stat: os.stat_result) -> str:
+        """Identify a file version by its metadata, without reading it.
+
+        Device, inode, mtime and size change whenever the file is replaced or
+        written, which makes them a near-perfect identity on one machine.
+        """
+        return f"{stat.st_dev}:{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _adopt_entry(
+        self, file_key: str, file_path: Path, stat: os.stat_result
+    ) -> None:
+        """Re-key an entry whose file only changed metadata, not content.
+
+        A checkout, ``touch`` or a cache restored on another machine changes the
+        fingerprint of an otherwise identical file. If an entry for the same
+        path and size has the same content hash, it is kept under the new
+        fingerprint instead of re-parsing the file; an outdated entry for the
+        path is dropped.
+        """
+        entries = self.cache_data.get("entries", {})
+        path_str = self._path_str(file_path)
+        old_key = next(
+            (
+                key
+                for key, entry in entries.items()
+                if entry.get("file_path") == path_str
+            ),
+            None,
+        )
+        if old_key is None:
+            return
+
+        entry = entries.pop(old_key)
+        self.dirty = True
+        if entry.get("file_size") == stat.st_size and entry.get(
+            "content_hash"
+        ) == self._compute_file_hash(file_path, stat):
+            entry["last_modified_ns"] = stat.st_mtime_ns
+            entries[file_key] = entry
+            self._log("rekey", old_key, file_key, stat.st_mtime_ns)
         else:
-            return (self.project_root / path).resolve()
+            self._log("drop", old_key)
+
+    def _path_str(self, path: Path) -> str:
+        """Return the interned string form of a resolved path (memoized)."""
+        path_str = self._path_strs.get(path)
+        if path_str is None:
+            path_str = self._path_strs[path] = sys.intern(str(path))
+        return path_str
+
+    def _compute_file_hash(
+        self, file_path: Path, stat: os.stat_result | None = None
+    ) -> str:
+        """Compute a content fingerprint of the file.
+
+        The hash is remembered together with the file's mtime and size; as long
+        as both are unchanged the file is not read again.
+        """
+        try:
+            if stat is None:
+                stat = file_path.stat()
+        except OSError as e:
+            raise SchemaCacheError(f"File not found: {file_path}") from e
 
-    def _compute_file_hash(self, file_path: Path) -> str:
-        """Compute SHA-256 hash of file content."""
-        if not file_path.exists():
-            raise SchemaCacheError(f"File not found: {file_path}")
+        known = self._meta_cache.get(file_path)
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2]
 
         try:
-            content = file_path.read_bytes()
-            return hashlib.sha1(content).hexdigest()
+            file_hash = self._hash_file(file_path)
         except OSError as e:
             raise SchemaCacheError(f"Failed to read file {file_path}: {e}") from e
 
+        self._meta_cache[file_path] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        """Hash file content in fixed-size chunks.
+
+        The hash only detects content changes, it is not a security feature:
+        xxh3 is used when available, SHA-1 otherwise.
+        """
+        hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.sha1()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
     def _is_cache_valid(
-        self, file_hash: str, file_path: Path, json_pointer: str
+        self,
+        file_key: str,
+        file_path: Path,
+        json_pointer: str,
+        stat: os.stat_result,
     ) -> bool:
-        """Check if cache entry is valid."""
-        entries = self.cache_data.get("entries", {})
-
-        if file_hash not in entries:
+        """Check if cache entry is valid against the file's current ``stat``."""
+        # Cheapest checks first: dict lookup, path identity, then integers
+        entry = self.cache_data.get("entries", {}).get(file_key)
+        if entry is None:
             return False
 
-        entry = entries[file_hash]
-
-        # Check if file path matches (in case of hash collision)
-        if entry.get("file_path") != str(file_path):
+        # Check if file path matches (in case of inode reuse); both sides
+        # are interned, so equal paths compare by identity
+        if entry.get("file_path") != self._path_str(file_path):
             return False
 
         # Check if file has been modified
-        try:
-            stat = file_path.stat()
-            if entry.get("file_size") != stat.st_size:
-                return False
-
-            last_modified = datetime.fromtimestamp(stat.st_mtime).isoformat() + "Z"
-            if entry.get("last_modified") != last_modified:
-                return False
-        except OSError:
+        if entry.get("file_size") != stat.st_size:
+            return False
+        if entry.get("last_modified_ns") != stat.st_mtime_ns:
             return False
 
         # Check if specific pointer is cached
@@ -224,43 +648,73 @@ class TedsSchemaCache:
         return json_pointer in pointers
 
     def _load_and_cache_schema(
-        self, file_path: Path, file_hash: str, json_pointer: str
+        self,
+        file_path: Path,
+        file_key: str,
+        json_pointer: str,
+        stat: os.stat_result,
     ) -> dict[str, Any]:
         """Load schema from file and cache it with optimized multi-pointer extraction."""
         try:
-            # Load the full schema document
-            content = file_path.read_text(encoding="utf-8")
-            full_schema = yaml_loader.load(content) or {}
+            full_schema, index, aliases = self._parse_document(file_path, stat)
 
             # Update cache entry metadata
-            stat = file_path.stat()
-            last_modified = datetime.fromtimestamp(stat.st_mtime).isoformat() + "Z"
-            cached_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+            cached_at = _utc_timestamp()
 
             entries = self.cache_data.setdefault("entries", {})
-            if file_hash not in entries:
-                entries[file_hash] = {
-                    "file_path": str(file_path),
+            entry = entries.get(file_key)
+            new_entry = entry is None
+            if new_entry:
+                metadata = {
+                    "file_path": self._path_str(file_path),
                     "file_size": stat.st_size,
-                    "last_modified": last_modified,
-                    "pointers": {},
+                    "last_modified_ns": stat.st_mtime_ns,
+                    "content_hash": self._compute_file_hash(file_path, stat),
+                }
+                entry = entries[file_key] = {
+                    **metadata,
+                    "pointers": OrderedDict(),
+                    "cached_at": {},
+                    "aliases": {},
                 }
+                self._log("entry", file_key, metadata)
 
             # Extract the requested pointer
-            schema_fragment = self._extract_pointer(full_schema, json_pointer)
-
-            # OPTIMIZATION: Pre-cache common schema pointers from components/schemas
-            # This dramatically improves performance for subsequent schema accesses
-            self._preemptively_cache_common_pointers(
-                entries[file_hash], full_schema, cached_at
-            )
-
-            # Cache the specific requested pointer (might already be cached by preemptive caching)
-            if json_pointer not in entries[file_hash]["pointers"]:
-                entries[file_hash]["pointers"][json_pointer] = {
-                    "schema": schema_fragment,
-                    "cached_at": cached_at,
-                }
+            target = aliases.get(json_pointer)
+            schema_fragment = index.get(target or json_pointer)
+            if schema_fragment is None:
+                schema_fragment = self._extract_pointer(full_schema, json_pointer)
+
+            # A new entry gets the whole index up front. An existing entry (also
+            # one loaded from disk) only gains the requested pointer, so a miss
+            # does not push its recently used pointers out of the LRU window.
+            # Shared objects are stored once; their other pointers only refer to
+            # the first one, so the saved cache does not repeat the subtree
+            pointers = entry["pointers"]
+            if new_entry:
+                for pointer, fragment in index.items():
+                    if pointer not in pointers:
+                        self._set_pointer(file_key, pointer, fragment, cached_at)
+                for pointer, alias_target in aliases.items():
+                    if pointer not in pointers:
+                        self._set_alias(file_key, pointer, alias_target, cached_at)
+
+            # Cache the specific requested pointer (e.g. "#" or a non-object value)
+            # as the most recently used one, then evict the least recently used
+            if target is not None:
+                if target not in pointers:
+                    self._set_pointer(file_key, target, schema_fragment, cached_at)
+                pointers.move_to_end(target)
+                if json_pointer not in pointers:
+                    self._set_alias(file_key, json_pointer, target, cached_at)
+            elif json_pointer not in pointers:
+                self._set_pointer(file_key, json_pointer, schema_fragment, cached_at)
+            pointers.move_to_end(json_pointer)
+            while len(pointers) > self.MAX_POINTERS_PER_FILE:
+                evicted, _ = pointers.popitem(last=False)
+                del entry["cached_at"][evicted]
+                entry["aliases"].pop(evicted, None)
+                self._log("evict", file_key, evicted)
 
             self.dirty = True
             return schema_fragment
@@ -270,100 +724,97 @@ class TedsSchemaCache:
                 f"Failed to load schema from {file_path}#{json_pointer}: {e}"
             ) from e
 
+    def _parse_document(
+        self, file_path: Path, stat: os.stat_result, loader: YAML = yaml_loader
+    ) -> tuple[Any, dict[str, Any], dict[str, str]]:
+        """Return ``(document, index, aliases)`` for a schema file.
+
+        A file is parsed and indexed once; later misses on the same unchanged
+        file (evicted or non-object pointers) reuse the result. Safe to call
+        from prime()'s worker threads, each passing its own ``loader``.
+        """
+        doc_key = (stat.st_mtime_ns, stat.st_size)
+        parsed = self._parsed_docs.get(file_path)
+        if parsed is not None and parsed[0] == doc_key:
+            return parsed[1:]
+
+        # Load the full schema document
+        content = file_path.read_text(encoding="utf-8")
+        full_schema = loader.load(content) or {}
+        # OPTIMIZATION: Index every object in the document by its pointer, so
+        # any later lookup in this file is a cache hit
+        index, aliases = self._build_pointer_index(full_schema)
+        with self._lock:
+            self._parsed_docs[file_path] = (doc_key, full_schema, index, aliases)
+        return full_schema, index, aliases
+
     def _extract_pointer(
         self, document: dict[str, Any], json_pointer: str
     ) -> dict[str, Any]:
         """Extract schema fragment using JSON pointer."""
-        if json_pointer == "#/" or json_pointer == "#":
-            return document
-
-        # Remove leading # and /
-        pointer = json_pointer.lstrip("#/")
-        if not pointer:
+        if json_pointer in _ROOT_POINTERS:
             return document
 
-        # Split pointer into parts and decode
-        parts = []
-        for part in pointer.split("/"):
-            # JSON Pointer unescaping: ~1 -> /, ~0 -> ~
-            part = part.replace("~1", "/").replace("~0", "~")
-            parts.append(part)
-
         # Traverse the document
-        current = document
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                raise SchemaCacheError(f"JSON pointer not found: {json_pointer}")
+        current: Any = document
+        for part in _parse_pointer(json_pointer):
+            if isinstance(current, dict):
+                current = current.get(part, _MISSING)
+                if current is not _MISSING:
+                    continue
+            raise SchemaCacheError(f"JSON pointer not found: {json_pointer}")
 
         return current if isinstance(current, dict) else {}
 
-    def _preemptively_cache_common_pointers(
-        self, cache_entry: dict[str, Any], full_schema: dict[str, Any], cached_at: str
-    ) -> None:
-        """Pre-cache common schema pointers to improve subsequent access performance."""
-        # Cache common OpenAPI/AsyncAPI structure pointers
-        # Note: common_patterns could be used for future pattern-based caching
-
-        # Try to find and cache all schemas in components/schemas
-        try:
-            components = full_schema.get("components", {})
-            schemas = components.get("schemas", {})
-
-            if schemas:
-                # Cache the container
-                cache_entry["pointers"]["#/components/schemas"] = {
-                    "schema": schemas,
-                    "cached_at": cached_at,
-                }
+    def _build_pointer_index(
+        self, document: Any
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Map the JSON pointer of every object in the document to that object.
 
-                # Cache individual schemas
-                for schema_name, schema_def in schemas.items():
-                    if isinstance(schema_def, dict):
-                        pointer = f"#/components/schemas/{schema_name}"
-                        cache_entry["pointers"][pointer] = {
-                            "schema": schema_def,
-                            "cached_at": cached_at,
-                        }
-        except Exception:
-            # Don't fail on preemptive caching errors
-            pass
-
-        # Try to find and cache definitions (JSON Schema draft-04/07 style)
-        try:
-            definitions = full_schema.get("definitions", {})
-            if definitions:
-                cache_entry["pointers"]["#/definitions"] = {
-                    "schema": definitions,
-                    "cached_at": cached_at,
-                }
+        Only objects are indexed, matching what _extract_pointer can resolve;
+        the root is stored under "#/". The traversal uses an explicit stack.
 
-                for def_name, def_schema in definitions.items():
-                    if isinstance(def_schema, dict):
-                        pointer = f"#/definitions/{def_name}"
-                        cache_entry["pointers"][pointer] = {
-                            "schema": def_schema,
-                            "cached_at": cached_at,
-                        }
-        except Exception:
-            pass
+        Objects shared between several places (YAML anchors and aliases) are
+        indexed and traversed once, under the first pointer found. Every other
+        pointer to them is returned as an alias of that first pointer.
+        """
+        index: dict[str, Any] = {}
+        aliases: dict[str, str] = {}
+        if not isinstance(document, dict):
+            return index, aliases
+
+        index["#/"] = document
+        seen: dict[int, str] = {id(document): "#/"}
+        stack: list[tuple[dict[str, Any], str]] = [(document, "#")]
+        while stack:
+            obj, path = stack.pop()
+            for key, value in obj.items():
+                if isinstance(value, dict):
+                    token = str(key).replace("~", "~0").replace("/", "~1")
+                    child_path = f"{path}/{token}"
+                    first_path = seen.setdefault(id(value), child_path)
+                    if first_path != child_path:
+                        aliases[child_path] = first_path
+                        continue
+                    index[child_path] = value
+                    stack.append((value, child_path))
+        return index, aliases
 
     def _extract_dependencies(self, schema: dict[str, Any]) -> list[str]:
-        """Extract $ref dependencies from schema (simple extraction)."""
-        dependencies = []
+        """Extract $ref dependencies from schema (simple extraction).
 
-        def collect_refs(obj: Any) -> None:
-            if isinstance(obj, dict):
-                if "$ref" in obj and isinstance(obj["$ref"], str):
-                    ref = obj["$ref"]
-                    if ref.startswith("#/"):
-                        dependencies.append(ref)
-                for value in obj.values():
-                    collect_refs(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    collect_refs(item)
-
-        collect_refs(schema)
+        Walks the schema with an explicit stack, so deeply nested documents
+        cannot hit the recursion limit. Refs are returned in document order.
+        """
+        dependencies = []
+        stack: list[Any] = [schema]
+        while stack:
+            obj = stack.pop()
+            if type(obj) is dict:
+                ref = obj.get("$ref")
+                if type(ref) is str and ref.startswith("#/"):
+                    dependencies.append(ref)
+                stack.extend(reversed(obj.values()))
+            elif type(obj) is list:
+                stack.extend(reversed(obj))
         return dependencies
@@ -1,56 +1,182 @@
 from __future__ import annotations
 
 import argparse
+import io
 import logging
 import logging.config
 import os
 import sys
+import traceback
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from ruamel.yaml import YAML
-
-from .cache import TedsSchemaCache
 from .errors import TedsError
-from .generate import generate_from_source_config, parse_generate_config
-from .validate import validate_file
-from .version import get_version, recommended_minor_str, supported_spec_range_str
 
+if TYPE_CHECKING:
+    from .cache import TedsSchemaCache
+
+# Command implementations import their dependencies (cache, validate, generate,
+# jsonschema) on first use, so --version, --help and the like stay fast.
+
+_HELP_FLAGS = frozenset({"-h", "--help"})
+_VERSION_FLAGS = frozenset({"--version", "-V"})
+_LOGGING_CONFIG_PATH = Path(__file__).resolve().parent.parent / "logging.yaml"
+# Level names logging accepts, including its WARN and FATAL aliases
+_LOG_LEVELS = frozenset(
+    {"DEBUG", "INFO", "WARNING", "WARN", "ERROR", "CRITICAL", "FATAL"}
+)
+# Below this many specs, starting worker processes (each re-importing the
+# validator and reloading the cache) costs more than it saves
+_PARALLEL_VERIFY_MIN_SPECS = 8
+
+
+def _load_logging_config() -> dict | None:
+    """Load logging.yaml, or return None when no logging config is available."""
+    # Hand the parser raw bytes when the file is on disk and let it decode
+    # them; otherwise look for a bundled copy. Neither means basic config.
+    config_source: str | bytes
+    try:
+        config_source = _LOGGING_CONFIG_PATH.read_bytes()
+    except OSError:
+        from .resources import read_text_resource
+
+        try:
+            config_source = read_text_resource("logging.yaml")
+        except FileNotFoundError:
+            return None
+
+    # Reuse the shared safe loader: every command loads ruamel.yaml anyway,
+    # and it picks the C parser when available instead of forcing pure mode.
+    from .yamlio import yaml_loader
+
+    return yaml_loader.load(config_source)
 
+
+@lru_cache(maxsize=1)
 def setup_logging():
-    """Setup logging from YAML config with environment variable override."""
-    # Find the logging config file
-    config_path = Path(__file__).parent.parent / "logging.yaml"
+    """Setup logging from YAML config with environment variable override.
 
-    if config_path.exists():
-        yaml = YAML(typ="safe", pure=True)
-        with open(config_path) as f:
-            config = yaml.load(f)
+    Runs once per process; later calls are no-ops.
+    """
+    # LOGLEVEL overrides the teds_core level in either branch
+    env_level = os.environ.get("LOGLEVEL", "").upper()
+    if env_level not in _LOG_LEVELS:
+        env_level = ""
 
+    config = _load_logging_config()
+    if config is not None:
         # Override log level from environment variable if set
-        env_level = os.getenv("LOGLEVEL", "").upper()
-        if (
-            env_level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-            and "loggers" in config
-            and "teds_core" in config["loggers"]
-        ):
+        if env_level and "loggers" in config and "teds_core" in config["loggers"]:
             # Set the teds_core logger level from environment
             config["loggers"]["teds_core"]["level"] = env_level
 
         logging.config.dictConfig(config)
     else:
         # Fallback to basic config
-        level = os.getenv("LOGLEVEL", "INFO").upper()
         logging.basicConfig(
-            level=getattr(logging, level, logging.INFO),
+            level=env_level or "INFO",
             format="%(name)s:%(levelname)s: %(message)s",
             stream=sys.stderr,
         )
 
 
+def _configure_network(args: argparse.Namespace) -> None:
+    """Configure network policy from arguments."""
+    try:
+        # .refs pulls in jsonschema, so it is imported here rather than at
+        # module level; verify and generate load it anyway.
+        from .refs import set_network_policy
+
+        set_network_policy(
+            args.allow_network,
+            timeout=args.network_timeout,
+            max_bytes=args.network_max_bytes,
+        )
+    except Exception:
+        pass
+
+
+@contextmanager
+def _schema_cache(args: argparse.Namespace) -> Iterator[TedsSchemaCache]:
+    """Yield the run's shared schema cache, or open one for direct callers."""
+    cache = getattr(args, "cache", None)
+    if cache is not None:
+        yield cache
+        return
+
+    from .cache import TedsSchemaCache
+
+    with TedsSchemaCache() as cache:
+        yield cache
+
+
+# Per-process schema cache of a parallel verify worker; loaded once, never saved.
+_worker_cache: TedsSchemaCache | None = None
+
+
+def _init_verify_worker(network: argparse.Namespace) -> None:
+    """Set up a worker process for _verify_spec_in_worker()."""
+    global _worker_cache
+
+    from .cache import TedsSchemaCache
+
+    setup_logging()  # No-op in forked workers, which inherit the parent's config
+    _configure_network(network)
+    _worker_cache = TedsSchemaCache()
+    _worker_cache.load()
+
+
+def _verify_spec_in_worker(
+    spec: str, output_level: str
+) -> tuple[int, str, str, list[list[Any]]]:
+    """Verify one spec; return its exit code, captured output and cache changes."""
+    from .validate import validate_file
+
+    assert _worker_cache is not None
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err), _redirect_log_streams(err):
+        rc = validate_file(Path(spec), output_level, False, _worker_cache)
+    return rc, out.getvalue(), err.getvalue(), _worker_cache.drain_changes()
+
+
+@contextmanager
+def _redirect_log_streams(stream: io.StringIO) -> Iterator[None]:
+    """Point the console log handlers at ``stream`` for the duration.
+
+    Handlers keep the stderr object they were configured with, so
+    redirect_stderr() alone would let a worker's log records bypass its
+    captured output and interleave with other specs.
+    """
+    loggers = (logging.getLogger(), logging.getLogger("teds_core"))
+    handlers = {
+        h
+        for logger in loggers
+        for h in logger.handlers
+        if type(h) is logging.StreamHandler
+    }
+    previous = {h: h.stream for h in handlers}
+    for h in handlers:
+        h.stream = stream
+    try:
+        yield
+    finally:
+        for h, original in previous.items():
+            h.stream = original
+
+
 class Command(ABC):
     """Abstract base class for CLI commands."""
 
+    # Commands are stateless; subclasses declare empty __slots__ as well
+    __slots__ = ()
+
+    # Whether main() should open the shared schema cache for this command
+    uses_cache: bool = False
+
     @abstractmethod
     def execute(self, args: argparse.Namespace) -> int:
         """Execute the command and return exit code."""
@@ -60,7 +186,15 @@ class Command(ABC):
 class VersionCommand(Command):
     """Command to display version information."""
 
+    __slots__ = ()
+
     def execute(self, _args: argparse.Namespace) -> int:
+        from .version import (
+            get_version,
+            recommended_minor_str,
+            supported_spec_range_str,
+        )
+
         print(
             f"teds {get_version()} (spec supported: {supported_spec_range_str()}; recommended: {recommended_minor_str()})"
         )
@@ -70,53 +204,39 @@ class VersionCommand(Command):
 class ListTemplatesCommand(Command):
     """Command to list available templates."""
 
+    __slots__ = ()
+
     def execute(self, _args: argparse.Namespace) -> int:
         from .report import list_templates
 
-        for it in list_templates():
-            print(f"{it.get('id')}: {it.get('description','').strip()}")
+        sys.stdout.write(
+            "".join(
+                f"{it.get('id')}: {it.get('description', '').strip()}\n"
+                for it in list_templates()
+            )
+        )
         return 0
 
 
 class VerifyCommand(Command):
     """Command to verify test specifications."""
 
+    __slots__ = ()
+
+    uses_cache = True
+
     def execute(self, args: argparse.Namespace) -> int:
-        self._configure_network(args)
+        _configure_network(args)
 
         if args.report:
             return self._handle_report_mode(args)
         else:
             return self._handle_verify_mode(args)
 
-    def _configure_network(self, args: argparse.Namespace) -> None:
-        """Configure network policy from arguments."""
-        try:
-            from .refs import set_network_policy
-
-            set_network_policy(
-                args.allow_network,
-                timeout=args.network_timeout,
-                max_bytes=args.network_max_bytes,
-            )
-        except Exception:
-            pass
-
     def _handle_report_mode(self, args: argparse.Namespace) -> int:
         """Handle verification with report generation."""
-        try:
-            # Parse TEMPLATE_ID or TEMPLATE_ID=OUTFILE
-            report_arg = args.report
-            tpl_id, out_override = (
-                ([*report_arg.split("=", 1), None])[:2]
-                if "=" in report_arg
-                else (report_arg, None)
-            )
-        except Exception:
-            import traceback
-
-            traceback.print_exc(file=sys.stderr)
-            return 2
+        # Parse TEMPLATE_ID or TEMPLATE_ID=OUTFILE (an empty OUTFILE means default)
+        tpl_id, _, out_override = args.report.partition("=")
 
         from .report import resolve_template, run_report_per_spec
 
@@ -127,39 +247,44 @@ class VerifyCommand(Command):
             return 2
 
         try:
-            with TedsSchemaCache() as cache:
+            with _schema_cache(args) as cache:
                 pairs, rc = run_report_per_spec(
                     [Path(s) for s in args.spec], tpl_id, args.output_level, cache
                 )
             multi = len(pairs) > 1
+            if out_override and multi:
+                print(
+                    "Explicit output path is only supported with a single SPEC",
+                    file=sys.stderr,
+                )
+                return 2
 
+            # Extract extension from template name, default to .md
+            tpl_parts = tpl_id.split(".")
+            ext = f".{tpl_parts[-1]}" if len(tpl_parts) > 1 else ".md"
+            tbase = tpl_parts[0]
+
+            write_status = sys.stderr.write
             for sp, content in pairs:
                 if out_override:
-                    if multi:
-                        print(
-                            "Explicit output path is only supported with a single SPEC",
-                            file=sys.stderr,
-                        )
-                        return 2
                     out_path = Path(out_override)
                 else:
                     base = sp.stem
-                    # Extract extension from template name, default to .md
-                    tpl_parts = tpl_id.split(".")
-                    ext = f".{tpl_parts[-1]}" if len(tpl_parts) > 1 else ".md"
-                    tbase = tpl_parts[0]
                     name = (
                         f"{base}.report{ext}"
                         if not multi
                         else f"{base}.{tbase}.report{ext}"
                     )
                     out_path = sp.parent / name
-                out_path.parent.mkdir(parents=True, exist_ok=True)
-                print(f"Generating report {out_path}", file=sys.stderr)
-                out_path.write_text(content, encoding="utf-8")
+                # The spec's own directory exists; only explicit targets may not
+                if out_path.parent != sp.parent:
+                    out_path.parent.mkdir(parents=True, exist_ok=True)
+                write_status(f"Generating report {out_path}\n")
+                out_path.write_bytes(content.encode("utf-8"))
+        except TedsError as e:
+            print(str(e), file=sys.stderr)
+            return 2
         except Exception:
-            import traceback
-
             traceback.print_exc(file=sys.stderr)
             return 2
 
@@ -167,29 +292,86 @@ class VerifyCommand(Command):
 
     def _handle_verify_mode(self, args: argparse.Namespace) -> int:
         """Handle standard verification mode."""
+        if len(args.spec) >= _PARALLEL_VERIFY_MIN_SPECS and not args.in_place:
+            rc = self._verify_in_parallel(args)
+            if rc is not None:
+                return rc
+
+        from .validate import validate_file
+
         rc_all = 0
-        with TedsSchemaCache() as cache:
+        action = "Updating" if args.in_place else "Verifying"
+        write_status = sys.stderr.write
+        with _schema_cache(args) as cache:
             for spec in args.spec:
                 spec_path = Path(spec)
-                if args.in_place:
-                    print(f"Updating {spec_path}", file=sys.stderr)
-                else:
-                    print(f"Verifying {spec_path}", file=sys.stderr)
+                # One write per spec; progress stays interleaved with results
+                write_status(f"{action} {spec_path}\n")
                 rc_all = max(
                     rc_all,
                     validate_file(spec_path, args.output_level, args.in_place, cache),
                 )
         return rc_all
 
+    def _verify_in_parallel(
+        self, args: argparse.Namespace, workers: int | None = None
+    ) -> int | None:
+        """Verify several specs in worker processes; None if no pool is available.
+
+        Each worker's output is captured and written out in spec order, so the
+        result matches a serial run. Schemas the workers fetch are merged into
+        the parent's cache, which is saved once at the end of the run.
+        ``workers`` defaults to one per CPU, up to one per spec.
+        """
+        if workers is None:
+            workers = min(len(args.spec), os.cpu_count() or 1)
+        if workers < 2:
+            return None
+        network = argparse.Namespace(
+            allow_network=args.allow_network,
+            network_timeout=args.network_timeout,
+            network_max_bytes=args.network_max_bytes,
+        )
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_verify_worker,
+                initargs=(network,),
+            )
+        except (ImportError, NotImplementedError, OSError):
+            return None
+
+        rc_all = 0
+        with pool, _schema_cache(args) as cache:
+            results = pool.map(
+                _verify_spec_in_worker,
+                args.spec,
+                [args.output_level] * len(args.spec),
+            )
+            for spec, (rc, out, err, changes) in zip(args.spec, results, strict=True):
+                sys.stderr.write(f"Verifying {Path(spec)}\n{err}")
+                sys.stdout.write(out)
+                cache.merge_changes(changes)
+                rc_all = max(rc_all, rc)
+        return rc_all
+
 
 class GenerateCommand(Command):
     """Command to generate test specifications."""
 
+    __slots__ = ()
+
+    uses_cache = True
+
     def execute(self, args: argparse.Namespace) -> int:
-        self._configure_network(args)
+        from .generate import generate_from_source_config, parse_generate_config
+
+        _configure_network(args)
 
         try:
-            with TedsSchemaCache() as cache:
+            with _schema_cache(args) as cache:
                 # Process each mapping argument
                 for mapping_str in args.mapping:
                     config = parse_generate_config(mapping_str)
@@ -213,52 +395,45 @@ class GenerateCommand(Command):
 
         return 0
 
-    def _configure_network(self, args: argparse.Namespace) -> None:
-        """Configure network policy from arguments."""
-        try:
-            from .refs import set_network_policy
-
-            set_network_policy(
-                args.allow_network,
-                timeout=args.network_timeout,
-                max_bytes=args.network_max_bytes,
-            )
-        except Exception:
-            pass
-
 
 class CacheCommand(Command):
     """Command for cache management operations."""
 
+    __slots__ = ()
+
+    uses_cache = True
+
     def execute(self, args: argparse.Namespace) -> int:
         if args.cache_action == "status":
-            return self._handle_status()
+            return self._handle_status(args)
         elif args.cache_action == "clear":
-            return self._handle_clear()
+            return self._handle_clear(args)
         elif args.cache_action == "stats":
-            return self._handle_stats()
+            return self._handle_stats(args)
         else:
             print(f"Unknown cache action: {args.cache_action}", file=sys.stderr)
             return 1
 
-    def _handle_status(self) -> int:
+    def _handle_status(self, args: argparse.Namespace) -> int:
         """Show cache status."""
         try:
-            with TedsSchemaCache() as cache:
+            with _schema_cache(args) as cache:
                 stats = cache.get_stats()
 
                 if not Path(stats["cache_file"]).exists():
                     print("Cache file does not exist")
                     return 0
 
-                print("TeDS Schema Cache Status:")
-                print(
-                    f"- Cache file: {stats['cache_file']} ({stats['cache_size_bytes']} bytes)"
-                )
-                print(f"- Cached files: {stats['cached_files']}")
-                print(f"- Cached pointers: {stats['cached_pointers']}")
-                print(f"- Last updated: {stats.get('last_updated', 'Never')}")
-                print(f"- Created: {stats.get('created', 'Unknown')}")
+                # Assemble the report and write it in one call
+                lines = [
+                    "TeDS Schema Cache Status:",
+                    f"- Cache file: {stats['cache_file']} ({stats['cache_size_bytes']} bytes)",
+                    f"- Cached files: {stats['cached_files']}",
+                    f"- Cached pointers: {stats['cached_pointers']}",
+                    f"- Last updated: {stats.get('last_updated', 'Never')}",
+                    f"- Created: {stats.get('created', 'Unknown')}",
+                ]
+                sys.stdout.write("\n".join(lines) + "\n")
 
         except Exception as e:
             print(f"Error reading cache: {e}", file=sys.stderr)
@@ -266,10 +441,10 @@ class CacheCommand(Command):
 
         return 0
 
-    def _handle_clear(self) -> int:
+    def _handle_clear(self, args: argparse.Namespace) -> int:
         """Clear cache."""
         try:
-            with TedsSchemaCache() as cache:
+            with _schema_cache(args) as cache:
                 cache.clear()
                 print("Cache cleared successfully")
 
@@ -279,32 +454,38 @@ class CacheCommand(Command):
 
         return 0
 
-    def _handle_stats(self) -> int:
+    def _handle_stats(self, args: argparse.Namespace) -> int:
         """Show detailed cache statistics."""
         try:
-            with TedsSchemaCache() as cache:
+            with _schema_cache(args) as cache:
                 stats = cache.get_stats()
 
-                print("TeDS Schema Cache Statistics:")
-                print(f"Cache Version: {cache.CACHE_VERSION}")
-                print(f"Cache File: {stats['cache_file']}")
-                print(f"File Size: {stats['cache_size_bytes']} bytes")
-                print(f"Cached Files: {stats['cached_files']}")
-                print(f"Cached Pointers: {stats['cached_pointers']}")
-                print(f"Created: {stats.get('created', 'Unknown')}")
-                print(f"Last Updated: {stats.get('last_updated', 'Never')}")
+                # Assemble the report and write it in one call
+                lines = [
+                    "TeDS Schema Cache Statistics:",
+                    f"Cache Version: {cache.CACHE_VERSION}",
+                    f"Cache File: {stats['cache_file']}",
+                    f"File Size: {stats['cache_size_bytes']} bytes",
+                    f"Cached Files: {stats['cached_files']}",
+                    f"Cached Pointers: {stats['cached_pointers']}",
+                    f"Created: {stats.get('created', 'Unknown')}",
+                    f"Last Updated: {stats.get('last_updated', 'Never')}",
+                ]
 
                 # Show cache entries if they exist
                 if stats["cached_files"] > 0:
-                    print("\nCached Schema Files:")
+                    lines += ["", "Cached Schema Files:"]
                     entries = cache.cache_data.get("entries", {})
-                    for file_hash, entry in entries.items():
+                    for entry in entries.values():
                         file_path = entry.get("file_path", "Unknown")
                         pointer_count = len(entry.get("pointers", {}))
-                        print(
+                        file_hash = entry.get("content_hash", "")
+                        lines.append(
                             f"  {file_path} ({pointer_count} pointers, hash: {file_hash[:12]}...)"
                         )
 
+                sys.stdout.write("\n".join(lines) + "\n")
+
         except Exception as e:
             print(f"Error reading cache stats: {e}", file=sys.stderr)
             return 1
@@ -315,6 +496,8 @@ class CacheCommand(Command):
 class ServeCommand(Command):
     """Command for starting HTTP API server."""
 
+    __slots__ = ()
+
     def execute(self, args: argparse.Namespace) -> int:
         """Start the HTTP API server."""
         try:
@@ -323,7 +506,7 @@ class ServeCommand(Command):
             from .http_api import create_teds_app
 
             # Create FastAPI app
-            root_dir = getattr(args, "root", os.getcwd())
+            root_dir = getattr(args, "root", None) or os.getcwd()
             app = create_teds_app(root_directory=root_dir)
 
             # Set port in app state for status endpoint
@@ -363,73 +546,63 @@ class ServeCommand(Command):
 
 
 class CommandRegistry:
-    """Registry for CLI commands."""
+    """Registry for CLI commands.
+
+    Commands are instantiated on first lookup, so a run only creates the
+    command it executes.
+    """
+
+    __slots__ = ("_instances",)
+
+    _classes: dict[str, type[Command]] = {
+        "version": VersionCommand,
+        "list-templates": ListTemplatesCommand,
+        "verify": VerifyCommand,
+        "generate": GenerateCommand,
+        "cache": CacheCommand,
+        "serve": ServeCommand,
+    }
 
     def __init__(self):
-        self._commands: dict[str, Command] = {
-            "version": VersionCommand(),
-            "list-templates": ListTemplatesCommand(),
-            "verify": VerifyCommand(),
-            "generate": GenerateCommand(),
-            "cache": CacheCommand(),
-            "serve": ServeCommand(),
-        }
+        self._instances: dict[str, Command] = {}
 
     def get_command(self, name: str) -> Command | None:
         """Get command by name."""
-        return self._commands.get(name)
+        command = self._instances.get(name)
+        if command is None:
+            command_cls = self._classes.get(name)
+            if command_cls is None:
+                return None
+            command = self._instances[name] = command_cls()
+        return command
 
     def has_command(self, name: str) -> bool:
         """Check if command exists."""
-        return name in self._commands
+        return name in self._classes
 
 
-def _build_parser() -> argparse.ArgumentParser:
-    ap = argparse.ArgumentParser(
-        prog="teds",
-        description=(
-            "Verify YAML testspecs against JSON Schemas, and generate specs from schema refs."
-        ),
-        epilog=(
-            "Exit codes:\n"
-            "  0  success\n"
-            "  1  validation produced ERROR cases\n"
-            "  2  hard failures (I/O, YAML parse, invalid testspec schema, schema/ref resolution, unexpected error)\n\n"
-            "Network access:\n"
-            "  By default, external $ref resolution is disabled (local-only).\n"
-            "  Use --allow-network to enable HTTP/HTTPS with a global timeout and size cap.\n"
-            "  Env overrides: TEDS_NETWORK_TIMEOUT (seconds), TEDS_NETWORK_MAX_BYTES (bytes).\n\n"
-        ),
-        formatter_class=argparse.RawTextHelpFormatter,
-    )
-    ap.add_argument(
-        "--allow-network",
-        action="store_true",
-        help="Allow HTTP/HTTPS $ref resolution (default: off). Applies global timeout and size caps.",
-    )
-    ap.add_argument(
-        "--network-timeout",
-        type=float,
-        default=None,
-        help="Timeout in seconds for HTTP/HTTPS $ref fetches (overrides env)",
-    )
-    ap.add_argument(
-        "--network-max-bytes",
-        type=int,
-        default=None,
-        help="Maximum bytes per HTTP/HTTPS resource (overrides env)",
-    )
-    sub = ap.add_subparsers(dest="cmd")
+# Shared by the top-level and verify help epilogs
+_EXIT_CODES_HELP = (
+    "Exit codes:\n"
+    "  0  success\n"
+    "  1  validation produced ERROR cases\n"
+    "  2  hard failures (I/O, YAML parse, invalid testspec schema, schema/ref resolution, unexpected error)\n"
+)
+
+# One-line summaries shown in the top-level help
+_SUBCOMMAND_HELP = {
+    "verify": "Verify one or more testspec files.",
+    "generate": "Generate testspec(s) from schema ref(s)",
+    "cache": "Manage schema cache",
+    "serve": "Start HTTP API server",
+}
+
 
+def _add_verify_parser(sub: argparse._SubParsersAction) -> None:
     p_verify = sub.add_parser(
         "verify",
-        help="Verify one or more testspec files.",
-        epilog=(
-            "Exit codes:\n"
-            "  0  success\n"
-            "  1  validation produced ERROR cases\n"
-            "  2  hard failures (I/O, YAML parse, invalid testspec schema, schema/ref resolution, unexpected error)\n"
-        ),
+        help=_SUBCOMMAND_HELP["verify"],
+        epilog=_EXIT_CODES_HELP,
         formatter_class=argparse.RawTextHelpFormatter,
     )
     p_verify.add_argument("spec", nargs="+", help="YAML testspec file(s)")
@@ -452,9 +625,11 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     # verify remains focused on validation; reporting moved to a dedicated subcommand
 
+
+def _add_generate_parser(sub: argparse._SubParsersAction) -> None:
     p_gen = sub.add_parser(
         "generate",
-        help="Generate testspec(s) from schema ref(s)",
+        help=_SUBCOMMAND_HELP["generate"],
         description=(
             "Generate testspec(s) for child schemas under a JSON Pointer.\n"
             "- Usage: teds generate REF[=TARGET] [REF[=TARGET] ...]\n"
@@ -483,10 +658,11 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_gen.add_argument("mapping", nargs="+", help="REF[=TARGET] mappings")
 
-    # Cache management subcommand
+
+def _add_cache_parser(sub: argparse._SubParsersAction) -> None:
     p_cache = sub.add_parser(
         "cache",
-        help="Manage schema cache",
+        help=_SUBCOMMAND_HELP["cache"],
         description="Manage the persistent schema cache used to speed up operations.",
         formatter_class=argparse.RawTextHelpFormatter,
     )
@@ -501,10 +677,11 @@ def _build_parser() -> argparse.ArgumentParser:
         ),
     )
 
-    # HTTP API server subcommand
+
+def _add_serve_parser(sub: argparse._SubParsersAction) -> None:
     p_serve = sub.add_parser(
         "serve",
-        help="Start HTTP API server",
+        help=_SUBCOMMAND_HELP["serve"],
         description="Start a local HTTP API server for TeDS operations.",
         formatter_class=argparse.RawTextHelpFormatter,
     )
@@ -521,42 +698,203 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_serve.add_argument(
         "--root",
-        default=os.getcwd(),
+        default=None,
         help="Root directory for file operations (default: current working directory)",
     )
 
+
+# Subcommand parsers are only built for the command being run; top-level help
+# only needs their names and summaries.
+_SUBPARSER_BUILDERS = {
+    "verify": _add_verify_parser,
+    "generate": _add_generate_parser,
+    "cache": _add_cache_parser,
+    "serve": _add_serve_parser,
+}
+
+
+@lru_cache(maxsize=8)
+def _build_parser(cmd: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser for `cmd`, or the top-level help parser for None.
+
+    Parsers are memoized per `cmd` for in-process re-invocation; parse_args
+    does not mutate them, and no default depends on the working directory.
+    """
+    ap = argparse.ArgumentParser(
+        prog="teds",
+        description=(
+            "Verify YAML testspecs against JSON Schemas, and generate specs from schema refs."
+        ),
+        epilog=(
+            _EXIT_CODES_HELP + "\n"
+            "Network access:\n"
+            "  By default, external $ref resolution is disabled (local-only).\n"
+            "  Use --allow-network to enable HTTP/HTTPS with a global timeout and size cap.\n"
+            "  Env overrides: TEDS_NETWORK_TIMEOUT (seconds), TEDS_NETWORK_MAX_BYTES (bytes).\n\n"
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    ap.add_argument(
+        "--allow-network",
+        action="store_true",
+        help="Allow HTTP/HTTPS $ref resolution (default: off). Applies global timeout and size caps.",
+    )
+    ap.add_argument(
+        "--network-timeout",
+        type=float,
+        default=None,
+        help="Timeout in seconds for HTTP/HTTPS $ref fetches (overrides env)",
+    )
+    ap.add_argument(
+        "--network-max-bytes",
+        type=int,
+        default=None,
+        help="Maximum bytes per HTTP/HTTPS resource (overrides env)",
+    )
+    sub = ap.add_subparsers(dest="cmd")
+
+    if cmd is None:
+        for name, summary in _SUBCOMMAND_HELP.items():
+            sub.add_parser(name, help=summary)
+    else:
+        _SUBPARSER_BUILDERS[cmd](sub)
+
     # No explicit report/templates subcommands; reporting is handled via verify --report and templates listing via top-level --list-templates.
 
     return ap
 
 
+_VERIFY_OUTPUT_LEVELS = ("all", "warning", "error")
+
+
+def _fast_parse_verify(argv: list[str]) -> argparse.Namespace | None:
+    """Parse a plain `verify` command line without building any parser.
+
+    Understands exactly the options of the verify subparser in their spelled-out
+    forms. Returns None for anything else (help, abbreviations, bundled short
+    flags, invalid values, interleaved or missing specs) so that argparse
+    handles it and reports errors as usual.
+    """
+    args = argparse.Namespace(
+        allow_network=False,
+        network_timeout=None,
+        network_max_bytes=None,
+        cmd="verify",
+        spec=[],
+        output_level="warning",
+        in_place=False,
+        report=None,
+    )
+    specs_done = False
+    i, n = 1, len(argv)
+    while i < n:
+        token = argv[i]
+        i += 1
+        if not token.startswith("-") or token == "-":
+            # argparse only accepts the specs as one contiguous run
+            if specs_done:
+                return None
+            args.spec.append(token)
+            continue
+        if args.spec:
+            specs_done = True
+        if token in ("-i", "--in-place"):
+            args.in_place = True
+            continue
+
+        name, eq, value = token.partition("=")
+        if name not in ("-l", "--output-level", "--report"):
+            if token.startswith("-l") and not token.startswith("--"):
+                name, eq, value = "-l", "=", token[2:]
+            else:
+                return None
+        if not eq:
+            if i == n or argv[i].startswith("-"):
+                return None
+            value = argv[i]
+            i += 1
+        if name == "--report":
+            args.report = value
+        elif value in _VERIFY_OUTPUT_LEVELS:
+            args.output_level = value
+        else:
+            return None
+
+    return args if args.spec else None
+
+
+def _fast_parse_generate(argv: list[str]) -> argparse.Namespace | None:
+    """Parse a plain `generate REF[=TARGET] ...` command line without argparse.
+
+    Returns None as soon as an option-like token shows up, so that argparse
+    handles help and errors as usual.
+    """
+    mapping = argv[1:]
+    if not mapping or any(m.startswith("-") and m != "-" for m in mapping):
+        return None
+    return argparse.Namespace(
+        allow_network=False,
+        network_timeout=None,
+        network_max_bytes=None,
+        cmd="generate",
+        mapping=mapping,
+    )
+
+
+# Subcommands whose common invocations are parsed without building a parser
+_FAST_PARSERS = {
+    "verify": _fast_parse_verify,
+    "generate": _fast_parse_generate,
+}
+
+
 def main() -> None:
     """Main CLI entry point using Command pattern."""
-    setup_logging()  # Initialize logging first
     argv = sys.argv[1:]
-    registry = CommandRegistry()
 
-    # Handle special cases first
-    exit_code = _handle_special_cases(argv, registry)
+    # Handle special cases first; they only print, so logging stays unconfigured
+    exit_code = _handle_special_cases(argv)
     if exit_code is not None:
         sys.exit(exit_code)
 
-    # Parse arguments for regular commands
-    ap = _build_parser()
-
-    if not argv or argv[0] not in {"verify", "generate", "cache", "serve"}:
-        ap.print_help(sys.stderr)
+    if not argv or argv[0] not in _SUBPARSER_BUILDERS:
+        _build_parser().print_help(sys.stderr)
         sys.exit(2)
 
-    try:
-        args = ap.parse_args(argv)
-        command = registry.get_command(args.cmd)
+    setup_logging()
 
-        if command:
+    # Parse arguments for regular commands; plain verify/generate runs skip argparse
+    fast_parse = _FAST_PARSERS.get(argv[0])
+    args = fast_parse(argv) if fast_parse else None
+
+    try:
+        if args is None:
+            args = _build_parser(argv[0]).parse_args(argv)
+        command = CommandRegistry().get_command(args.cmd)
+
+        if command and command.uses_cache:
+            from .cache import SchemaCacheError, TedsSchemaCache
+
+            # One cache per run, loaded once and saved once on exit. Only cache
+            # I/O is reported here; command errors keep their own handling.
+            args.cache = TedsSchemaCache()
+            try:
+                args.cache.load()
+            except SchemaCacheError as e:
+                print(f"Schema cache error: {e}", file=sys.stderr)
+                sys.exit(2)
+            exit_code = command.execute(args)
+            try:
+                args.cache.save()
+            except SchemaCacheError as e:
+                print(f"Schema cache error: {e}", file=sys.stderr)
+                exit_code = max(exit_code, 2)
+            sys.exit(exit_code)
+        elif command:
             exit_code = command.execute(args)
             sys.exit(exit_code)
         else:
-            ap.print_help(sys.stderr)
+            _build_parser().print_help(sys.stderr)
             sys.exit(2)
 
     except Exception as e:
@@ -564,20 +902,21 @@ def main() -> None:
         sys.exit(2)
 
 
-def _handle_special_cases(argv: list[str], registry: CommandRegistry) -> int | None:
-    """Handle special command-line cases that don't require full parsing."""
-    if not argv or argv[0] in {"-h", "--help"}:
+def _handle_special_cases(argv: list[str]) -> int | None:
+    """Handle special command-line cases that don't require full parsing.
+
+    These run their commands directly, without building a CommandRegistry.
+    """
+    if not argv or argv[0] in _HELP_FLAGS:
         ap = _build_parser()
         ap.print_help(sys.stderr if argv else sys.stdout)
         return 0
 
-    if argv[0] in {"--version", "-V"}:
-        command = registry.get_command("version")
-        return command.execute(argparse.Namespace()) if command else 2
+    if argv[0] in _VERSION_FLAGS:
+        return VersionCommand().execute(argparse.Namespace())
 
     if "--list-templates" in argv:
-        command = registry.get_command("list-templates")
-        return command.execute(argparse.Namespace()) if command else 2
+        return ListTemplatesCommand().execute(argparse.Namespace())
 
     return None  # Continue with normal processing
 
@@ -423,7 +423,11 @@ def generate_from_source_config(
             f"Processing source: source_file_str='{source_file_str}', base_dir={base_dir}"
         )
 
-        # Determine target file (no schema path resolution yet)
+        # Schema paths are always relative to working directory (base_dir)
+        # This ensures consistent behavior regardless of target specification
+        schema_file = base_dir / source_file_str
+
+        # Determine target file
         if source_config["target"]:
             # Explicit target: relative to cwd with template variable expansion
             target_name = expand_target_template(
@@ -435,24 +439,22 @@ def generate_from_source_config(
             )
         else:
             # Default: {base}.tests.yaml next to schema file
-            schema_file = base_dir / source_file_str
             target_name = f"{schema_file.stem}.tests.yaml"
             target_path = schema_file.parent / target_name
             logger.debug(
                 f"Default target: target_name='{target_name}', target_path={target_path}"
             )
 
-        # Determine schema file path for JsonPath expansion
-        # Schema paths are always relative to working directory (base_dir)
-        # This ensures consistent behavior regardless of target specification
-        schema_file = base_dir / source_file_str
-
-        # Calculate correct reference path relative to test file directory
-        try:
-            reference_path = os.path.relpath(schema_file, target_path.parent)
-        except ValueError:
-            # Fallback if relative path calculation fails
-            reference_path = source_file_str
+        # Calculate correct reference path relative to test file directory;
+        # a test file next to its schema (the default) needs no relpath
+        if target_path.parent == schema_file.parent:
+            reference_path = schema_file.name
+        else:
+            try:
+                reference_path = os.path.relpath(schema_file, target_path.parent)
+            except ValueError:
+                # Fallback if relative path calculation fails
+                reference_path = source_file_str
 
         logger.debug(
             f"Before expand_jsonpath_expressions: schema_file={schema_file}, paths={source_config['paths']}, reference_path={reference_path}"
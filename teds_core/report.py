@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import io
 from collections.abc import Iterable
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -15,7 +17,7 @@ from .version import (
     recommended_minor_str,
     supported_spec_range_str,
 )
-from .yamlio import yaml_loader
+from .yamlio import yaml_dumper, yaml_loader
 
 
 @dataclass
@@ -47,12 +49,8 @@ def _compute_counts(doc: dict[str, Any]) -> dict[str, int]:
 def _render_jinja_str(
     template_key: str, template_text: str, context: dict[str, Any]
 ) -> str:
-    import io
-
     from jinja2 import DictLoader, Environment, select_autoescape
 
-    from .yamlio import yaml_dumper
-
     def strip_document_end_marker(s):
         """Remove YAML document end markers for cleaner template output."""
         if s.endswith("...\n"):
@@ -108,8 +106,6 @@ def resolve_template(template_id: str) -> tuple[str, str, str]:
 
 
 def build_context(inputs: Iterable[ReportInput]) -> dict[str, Any]:
-    from datetime import datetime
-
     ins = list(inputs)
     totals = {"success": 0, "warning": 0, "error": 0, "specs": len(ins)}
     for ri in ins:
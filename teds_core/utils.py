@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import re
 import urllib.parse
+from functools import lru_cache
 from pathlib import Path
 
 from jsonpath_ng.jsonpath import Fields, Index, Root
 
+_CURRENT_DIR = Path(".")
+_TEMPLATE_TOKEN_RE = re.compile(
+    r"\{(base|ext|file|dir|pointer|pointer_raw|pointer_strict)\}"
+)
+
 
 def json_path_to_json_pointer(full_path) -> str:
     """
@@ -67,6 +74,29 @@ def sanitize_pointer(s: str) -> str:
     return s.replace("~", "~0").replace("/", "~1")
 
 
+@lru_cache(maxsize=256)
+def _file_template_vars(file_part: str) -> dict[str, str]:
+    # Path parsing is done once per schema file; callers must not mutate the result
+    file_path = Path(file_part)
+    return {
+        "base": file_path.stem,
+        "ext": file_path.suffix.lstrip("."),
+        "file": file_path.name,
+        "dir": str(file_path.parent) if file_path.parent != _CURRENT_DIR else "",
+    }
+
+
+@lru_cache(maxsize=1024)
+def _pointer_template_vars(pointer: str) -> dict[str, str]:
+    # The same pointers (most often the root, "") recur across mappings
+    pointer_raw = pointer.lstrip("/")
+    return {
+        "pointer": sanitize_pointer(pointer_raw),
+        "pointer_raw": pointer_raw,
+        "pointer_strict": urllib.parse.quote(pointer_raw, safe=""),
+    }
+
+
 def expand_target_template(target: str, file_part: str, pointer: str) -> str:
     """Expand template variables in target path.
 
@@ -87,30 +117,11 @@ def expand_target_template(target: str, file_part: str, pointer: str) -> str:
         {pointer_raw} - JSON Pointer without leading '/' (slashes preserved)
         {pointer_strict} - JSON Pointer without leading '/', percent-encoded
     """
-    file_path = Path(file_part)
-    base = file_path.stem
-    ext = file_path.suffix.lstrip(".")
-    file_name = file_path.name
-    dir_name = str(file_path.parent) if file_path.parent != Path(".") else ""
-
-    pointer_raw = pointer.lstrip("/")
-    pointer_sanitized = sanitize_pointer(pointer_raw)
-    pointer_strict = urllib.parse.quote(pointer_raw, safe="")
+    if "{" not in target:
+        return target
 
     # Template variables
-    variables = {
-        "base": base,
-        "ext": ext,
-        "file": file_name,
-        "dir": dir_name,
-        "pointer": pointer_sanitized,
-        "pointer_raw": pointer_raw,
-        "pointer_strict": pointer_strict,
-    }
-
-    # Expand templates
-    expanded = target
-    for var, value in variables.items():
-        expanded = expanded.replace(f"{{{var}}}", value)
+    variables = {**_file_template_vars(file_part), **_pointer_template_vars(pointer)}
 
-    return expanded
+    # Expand all tokens in one pass; unknown {names} are left as-is
+    return _TEMPLATE_TOKEN_RE.sub(lambda m: variables[m.group(1)], target)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 from collections.abc import Generator
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,9 +12,11 @@ from jsonschema import ValidationError as JsonSchemaValidationError
 
 from .cache import TedsSchemaCache
 from .refs import build_validator_for_ref, collect_examples
+from .resources import read_text_resource
 from .version import (
     RECOMMENDED_TESTSPEC_VERSION,
     SUPPORTED_TESTSPEC_MAJOR,
+    SpecVersionIssue,
     check_spec_compat,
     recommended_minor_str,
     supported_spec_range_str,
@@ -284,13 +287,17 @@ def _evaluate_case(
     return case_key, out_case, 1 if result == "ERROR" else 0
 
 
-def _validate_testspec_against_schema(doc: dict[str, Any], _repo_root: Path) -> None:
+@lru_cache(maxsize=1)
+def _testspec_validator() -> Draft202012Validator:
     # Load schema via package resources for installed wheels, with repo-root fallback for dev.
-    from .resources import read_text_resource
-
     schema_text = read_text_resource("spec_schema.yaml")
     schema = yaml_loader.load(schema_text) or {}
-    Draft202012Validator(schema).validate(doc)
+    return Draft202012Validator(schema)
+
+
+def _validate_testspec_against_schema(doc: dict[str, Any], _repo_root: Path) -> None:
+    # The spec schema is read, parsed and compiled once per process
+    _testspec_validator().validate(doc)
 
 
 def _visible(level: str, result: str) -> bool:
@@ -458,6 +465,14 @@ def validate_doc(
     rc = 0
     out_tests: dict = {}
 
+    if cache is not None:
+        # Load every referenced schema file up front, in parallel when cold
+        cache.prime(
+            testspec_dir / file_part
+            for file_part, _, _ in (str(ref).partition("#") for ref in tests)
+            if file_part
+        )
+
     for schema_ref, value in tests.items():
         out_group, ref_rc = _process_schema_ref(
             schema_ref, value, testspec_dir, output_level, in_place, cache
@@ -505,8 +520,6 @@ def validate_file(
     ver = str(doc.get("version", "")).strip()
     ok, reason = check_spec_compat(ver)
     if not ok:
-        from .version import SpecVersionIssue
-
         if reason == SpecVersionIssue.INVALID:
             print(
                 f"Spec version invalid: {testspec_path}\n  value: {ver or '<missing>'}",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 from importlib import metadata
 from pathlib import Path
 from subprocess import run
@@ -57,7 +58,9 @@ def _from_git() -> str | None:
         return None  # Git command not available or failed
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
+    # Memoized: the git fallback spawns a subprocess, and reports ask per spec
     return _from_pkg() or _from_git() or "0.0.0+dev"
 
 
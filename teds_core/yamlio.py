@@ -2,9 +2,19 @@ from __future__ import annotations
 
 from ruamel.yaml import YAML
 
-# strict YAML loader (reject duplicate keys everywhere)
-yaml_loader = YAML(typ="safe")
-yaml_loader.allow_duplicate_keys = False
+
+def make_yaml_loader() -> YAML:
+    """Create a strict YAML loader (reject duplicate keys everywhere).
+
+    A YAML instance keeps parser state while loading, so threads that parse
+    concurrently need one each.
+    """
+    loader = YAML(typ="safe")
+    loader.allow_duplicate_keys = False
+    return loader
+
+
+yaml_loader = make_yaml_loader()
 
 # YAML dumper for output
 yaml_dumper = YAML()
@@ -1,11 +1,13 @@
 """Unit tests for TeDS schema cache functionality."""
 
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from teds_core import cache as cache_module
 from teds_core.cache import SchemaCacheError, TedsSchemaCache
 
 
@@ -26,7 +28,9 @@ class TestTedsSchemaCacheBasics(unittest.TestCase):
         """Test that cache initializes with empty structure."""
         self.cache.load()
 
-        self.assertEqual(self.cache.cache_data["cache_version"], "1.0")
+        self.assertEqual(
+            self.cache.cache_data["cache_version"], TedsSchemaCache.CACHE_VERSION
+        )
         self.assertIn("created", self.cache.cache_data)
         self.assertIn("last_updated", self.cache.cache_data)
         self.assertEqual(self.cache.cache_data["entries"], {})
@@ -42,7 +46,7 @@ class TestTedsSchemaCacheBasics(unittest.TestCase):
         # Verify JSON structure
         with open(cache_file) as f:
             data = json.load(f)
-        self.assertEqual(data["cache_version"], "1.0")
+        self.assertEqual(data["cache_version"], TedsSchemaCache.CACHE_VERSION)
         self.assertIn("entries", data)
 
     def test_context_manager_loads_and_saves(self):
@@ -57,6 +61,29 @@ class TestTedsSchemaCacheBasics(unittest.TestCase):
         # Cache file should exist after context exit
         self.assertTrue(cache_file.exists())
 
+    def test_clear_overwrites_existing_cache_file(self):
+        """Test that clearing replaces the saved entries with an empty cache."""
+        cache_file = self.temp_path / ".teds-schema-cache.json"
+        self.cache.load()
+        self.cache.cache_data["entries"]["fake_hash"] = {"pointers": {}}
+        self.cache.save()
+
+        self.cache.clear()
+        self.cache.save()
+
+        with open(cache_file) as f:
+            self.assertEqual(json.load(f)["entries"], {})
+
+    def test_durable_save_writes_via_temp_file(self):
+        """Test that durable mode replaces the cache file atomically."""
+        cache = TedsSchemaCache(self.temp_path, durable=True)
+        cache.load()
+        cache.save()
+
+        cache_file = self.temp_path / ".teds-schema-cache.json"
+        self.assertTrue(cache_file.exists())
+        self.assertFalse(cache_file.with_suffix(".tmp").exists())
+
     def test_get_stats_returns_correct_information(self):
         """Test that get_stats returns accurate cache statistics."""
         self.cache.load()
@@ -158,6 +185,151 @@ components:
 
         self.assertEqual(schema1, schema2)
 
+    def test_unchanged_file_is_not_rehashed(self):
+        """Test that unchanged mtime and size reuse the known file hash."""
+        self.cache.load()
+
+        self.cache.get_schema(self.schema_file, "#/")
+
+        # A different pointer misses the cache but must not rehash the file
+        with patch.object(TedsSchemaCache, "_hash_file") as mock_hash:
+            self.cache.get_schema(self.schema_file, "#/properties")
+            mock_hash.assert_not_called()
+
+    def test_first_load_indexes_every_object_pointer(self):
+        """Test that one load caches all object pointers in the document."""
+        self.cache.load()
+
+        self.cache.get_schema(self.schema_file, "#/")
+
+        (entry,) = self.cache.cache_data["entries"].values()
+        self.assertIn("#/properties/id", entry["pointers"])
+        self.assertIn("#/components/schemas/User/properties/email", entry["pointers"])
+        with patch("pathlib.Path.read_text") as mock_read:
+            node = self.cache.get_schema(self.schema_file, "#/properties/name")
+            mock_read.assert_not_called()
+        self.assertEqual(node, {"type": "string"})
+
+    def test_pointers_per_file_are_lru_bounded(self):
+        """Test that least recently used pointers are evicted beyond the limit."""
+        self.cache.load()
+
+        with patch.object(TedsSchemaCache, "MAX_POINTERS_PER_FILE", 3):
+            self.cache.get_schema(self.schema_file, "#/properties/id")
+
+        (entry,) = self.cache.cache_data["entries"].values()
+        pointers = entry["pointers"]
+        self.assertEqual(len(pointers), 3)
+        # The requested pointer is the most recently used and survives
+        self.assertEqual(next(reversed(pointers)), "#/properties/id")
+
+    def test_lru_order_survives_save_and_load(self):
+        """Test that pointers reordered by hits are saved in LRU order."""
+        self.cache.load()
+        self.cache.get_schema(self.schema_file, "#/properties/id")
+        self.cache.get_schema(self.schema_file, "#/properties/name")
+        self.cache.get_schema(self.schema_file, "#/properties/id")  # Hit
+        (entry,) = self.cache.cache_data["entries"].values()
+        order = list(entry["pointers"])
+        self.cache.save()
+
+        cache = TedsSchemaCache(self.temp_path)
+        cache.load()
+        (entry,) = cache.cache_data["entries"].values()
+        self.assertEqual(list(entry["pointers"]), order)
+        self.assertEqual(order[-1], "#/properties/id")
+
+    def test_miss_in_new_process_keeps_hot_pointers(self):
+        """Test that a miss on an entry loaded from disk evicts only one pointer."""
+        self.schema_file.write_text(
+            "definitions:\n"
+            + "".join(f"  D{i}:\n    type: string\n" for i in range(16))
+        )
+        with patch.object(TedsSchemaCache, "MAX_POINTERS_PER_FILE", 6):
+            with TedsSchemaCache(self.temp_path) as cache:
+                cache.get_schema(self.schema_file, "#/definitions/D0")
+                cache.get_schema(self.schema_file, "#/definitions/D1")
+
+            # A fresh instance parses the file again on its first miss
+            cache = TedsSchemaCache(self.temp_path)
+            cache.load()
+            cache.get_schema(self.schema_file, "#/definitions/D10")
+
+        (entry,) = cache.cache_data["entries"].values()
+        pointers = list(entry["pointers"])
+        self.assertEqual(len(pointers), 6)
+        self.assertEqual(
+            pointers[-3:],
+            ["#/definitions/D0", "#/definitions/D1", "#/definitions/D10"],
+        )
+        self.assertEqual([op[0] for op in cache.drain_changes()], ["set", "evict"])
+
+    def test_shared_objects_are_cached_once(self):
+        """Test that YAML aliases are stored as references to the first pointer."""
+        self.schema_file.write_text(
+            "definitions:\n  User: &user\n    type: object\n  Admin: *user\n"
+        )
+        self.cache.load()
+
+        admin = self.cache.get_schema(self.schema_file, "#/definitions/Admin")
+
+        self.assertEqual(admin, {"type": "object"})
+        (entry,) = self.cache.cache_data["entries"].values()
+        self.assertEqual(
+            entry["aliases"], {"#/definitions/Admin": "#/definitions/User"}
+        )
+        self.assertIsNone(entry["pointers"]["#/definitions/Admin"])
+        with patch("pathlib.Path.read_text") as mock_read:
+            cached = self.cache.get_schema(self.schema_file, "#/definitions/Admin")
+            mock_read.assert_not_called()
+        self.assertEqual(cached, {"type": "object"})
+
+    def test_schema_resembling_an_alias_is_returned_as_is(self):
+        """Test that a real fragment shaped like an alias is not resolved."""
+        self.schema_file.write_text(
+            "definitions:\n"
+            "  User: {type: object}\n"
+            "  Ref: {$cache_ref: '#/definitions/User'}\n"
+        )
+        with TedsSchemaCache(self.temp_path) as cache:
+            cache.get_schema(self.schema_file, "#/definitions/User")
+
+        cache = TedsSchemaCache(self.temp_path)
+        cache.load()
+        ref = cache.get_schema(self.schema_file, "#/definitions/Ref")
+
+        self.assertEqual(ref, {"$cache_ref": "#/definitions/User"})
+
+    def test_unchanged_file_is_parsed_once(self):
+        """Test that misses on an already parsed file reuse the document."""
+        self.cache.load()
+
+        self.cache.get_schema(self.schema_file, "#/")
+        # Non-object pointers are not indexed, so these are cache misses
+        with patch("pathlib.Path.read_text") as mock_read:
+            self.cache.get_schema(self.schema_file, "#/type")
+            self.cache.get_schema(self.schema_file, "#")
+            mock_read.assert_not_called()
+
+    def test_prime_parses_files_ahead_of_use(self):
+        """Test that primed files are not read again by get_schema."""
+        other_file = self.temp_path / "other_schema.yaml"
+        other_file.write_text("type: string\n")
+        missing_file = self.temp_path / "missing.yaml"
+        self.cache.load()
+
+        self.cache.prime([self.schema_file, other_file, missing_file])
+
+        with patch("pathlib.Path.read_text") as mock_read:
+            user = self.cache.get_schema(self.schema_file, "#/components/schemas/User")
+            other = self.cache.get_schema(other_file, "#/")
+            mock_read.assert_not_called()
+        self.assertEqual(user["type"], "object")
+        self.assertEqual(other, {"type": "string"})
+        # Primed files are indexed in full once they are first used
+        (entry, _) = self.cache.cache_data["entries"].values()
+        self.assertIn("#/properties/id", entry["pointers"])
+
     def test_get_schema_file_not_found_raises_error(self):
         """Test error handling for non-existent files."""
         self.cache.load()
@@ -191,6 +363,28 @@ components:
         self.assertEqual(self.cache.get_stats()["cached_files"], 0)
         self.assertTrue(self.cache.dirty)
 
+    def test_extract_pointer_unescapes_tokens(self):
+        """Test that ~1 and ~0 are decoded per RFC 6901."""
+        document = {"paths": {"/users": {"get": {"x~y": {"type": "string"}}}}}
+
+        fragment = self.cache._extract_pointer(document, "#/paths/~1users/get/x~0y")
+
+        self.assertEqual(fragment, {"type": "string"})
+
+    def test_extract_dependencies_handles_deep_nesting(self):
+        """Test that $ref collection does not recurse per nesting level."""
+        schema = {"$ref": "#/definitions/Root", "items": [{"$ref": "#/a"}]}
+        node = schema
+        for _ in range(5000):
+            node["child"] = {}
+            node = node["child"]
+        node["$ref"] = "#/definitions/Leaf"
+
+        self.assertEqual(
+            self.cache._extract_dependencies(schema),
+            ["#/definitions/Root", "#/a", "#/definitions/Leaf"],
+        )
+
 
 class TestTedsSchemaCacheInvalidation(unittest.TestCase):
     """Test cache invalidation based on file changes."""
@@ -226,6 +420,20 @@ class TestTedsSchemaCacheInvalidation(unittest.TestCase):
         self.assertEqual(schema2["type"], "string")
         self.assertNotEqual(schema1, schema2)
 
+    def test_touched_file_with_same_content_keeps_entry(self):
+        """Test that a new mtime with identical content reuses cached pointers."""
+        self.cache.load()
+        self.cache.get_schema(self.schema_file, "#/")
+
+        stat = self.schema_file.stat()
+        os.utime(self.schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch("pathlib.Path.read_text") as mock_read:
+            schema = self.cache.get_schema(self.schema_file, "#/")
+            mock_read.assert_not_called()
+        self.assertEqual(schema["type"], "object")
+        self.assertEqual(len(self.cache.cache_data["entries"]), 1)
+
     def test_file_size_change_invalidates_cache(self):
         """Test that file size changes invalidate cache."""
         self.cache.load()
@@ -242,6 +450,108 @@ class TestTedsSchemaCacheInvalidation(unittest.TestCase):
         self.assertIn("description", new_schema)
 
 
+class TestTedsSchemaCacheJournal(unittest.TestCase):
+    """Test journaled saves and compaction."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.cache_file = self.temp_path / ".teds-schema-cache.json"
+        self.journal_file = self.temp_path / ".teds-schema-cache.log"
+
+        self.first = self.temp_path / "first.yaml"
+        self.first.write_text("definitions:\n  A:\n    type: string\n")
+        self.second = self.temp_path / "second.yaml"
+        self.second.write_text("definitions:\n  B:\n    type: integer\n")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_later_saves_append_to_journal(self):
+        """Test that new entries are journaled instead of rewriting the snapshot."""
+        with TedsSchemaCache(self.temp_path) as cache:
+            cache.get_schema(self.first, "#/definitions/A")
+        snapshot = self.cache_file.read_bytes()
+        self.assertFalse(self.journal_file.exists())
+
+        with TedsSchemaCache(self.temp_path) as cache:
+            cache.get_schema(self.second, "#/definitions/B")
+
+        self.assertEqual(self.cache_file.read_bytes(), snapshot)
+        self.assertTrue(self.journal_file.exists())
+
+        cache = TedsSchemaCache(self.temp_path)
+        cache.load()
+        self.assertEqual(cache.get_stats()["cached_files"], 2)
+        with patch("pathlib.Path.read_text") as mock_read:
+            node = cache.get_schema(self.second, "#/definitions/B")
+            mock_read.assert_not_called()
+        self.assertEqual(node, {"type": "integer"})
+
+    def test_large_journal_is_compacted(self):
+        """Test that a journal outgrowing the snapshot is folded into it."""
+        with TedsSchemaCache(self.temp_path) as cache:
+            cache.get_schema(self.first, "#/definitions/A")
+
+        with TedsSchemaCache(self.temp_path) as cache:
+            cache.get_schema(self.second, "#/definitions/B")
+            cache._snapshot_size = 0  # Force the journal over the threshold
+
+        self.assertFalse(self.journal_file.exists())
+        data = json.loads(self.cache_file.read_text())
+        self.assertEqual(len(data["entries"]), 2)
+
+    def test_compaction_does_not_encode_the_journal(self):
+        """Test that a journal bound for compaction is never serialized."""
+        with TedsSchemaCache(self.temp_path) as cache:
+            cache.get_schema(self.first, "#/definitions/A")
+
+        with TedsSchemaCache(self.temp_path) as cache:
+            cache.get_schema(self.second, "#/definitions/B")
+            cache._snapshot_records = 0  # Force the op count over the threshold
+            with patch(
+                "teds_core.cache._json_dumps", wraps=cache_module._json_dumps
+            ) as dumps:
+                cache.save()
+
+        dumps.assert_called_once_with(cache.cache_data)
+        self.assertFalse(self.journal_file.exists())
+
+    def test_torn_journal_line_is_ignored(self):
+        """Test that a partially written journal line does not break loading."""
+        with TedsSchemaCache(self.temp_path) as cache:
+            cache.get_schema(self.first, "#/definitions/A")
+        self.journal_file.write_text('["set", "truncated')
+
+        cache = TedsSchemaCache(self.temp_path)
+        cache.load()
+
+        self.assertEqual(cache.get_stats()["cached_files"], 1)
+        self.assertTrue(cache.dirty)
+
+    def test_drained_changes_merge_into_another_cache(self):
+        """Test that a worker's changes persist when merged into the saving cache."""
+        worker = TedsSchemaCache(self.temp_path)
+        worker.load()
+        worker.get_schema(self.first, "#/definitions/A")
+        changes = worker.drain_changes()
+        self.assertTrue(changes)
+        self.assertEqual(worker.drain_changes(), [])
+
+        with TedsSchemaCache(self.temp_path) as cache:
+            cache.merge_changes(changes)
+
+        cache = TedsSchemaCache(self.temp_path)
+        cache.load()
+        self.assertEqual(cache.get_stats()["cached_files"], 1)
+        with patch("pathlib.Path.read_text") as mock_read:
+            node = cache.get_schema(self.first, "#/definitions/A")
+            mock_read.assert_not_called()
+        self.assertEqual(node, {"type": "string"})
+
+
 class TestTedsSchemaCacheErrorHandling(unittest.TestCase):
     """Test error handling and edge cases."""
 
@@ -264,7 +574,9 @@ class TestTedsSchemaCacheErrorHandling(unittest.TestCase):
 
         # Should reinitialize without error
         self.cache.load()
-        self.assertEqual(self.cache.cache_data["cache_version"], "1.0")
+        self.assertEqual(
+            self.cache.cache_data["cache_version"], TedsSchemaCache.CACHE_VERSION
+        )
         self.assertTrue(self.cache.dirty)
 
     def test_old_cache_version_reinitializes(self):
@@ -278,7 +590,9 @@ class TestTedsSchemaCacheErrorHandling(unittest.TestCase):
 
         # Should reinitialize with current version
         self.cache.load()
-        self.assertEqual(self.cache.cache_data["cache_version"], "1.0")
+        self.assertEqual(
+            self.cache.cache_data["cache_version"], TedsSchemaCache.CACHE_VERSION
+        )
         self.assertTrue(self.cache.dirty)
 
     def test_relative_path_resolution(self):
@@ -294,6 +608,17 @@ class TestTedsSchemaCacheErrorHandling(unittest.TestCase):
 
         self.assertEqual(schema["type"], "object")
 
+    def test_path_resolution_is_memoized(self):
+        """Test that repeated lookups of one path resolve it only once."""
+        schema_file = self.temp_path / "schema.yaml"
+        schema_file.write_text("type: object")
+        self.cache.load()
+
+        self.cache.get_schema("schema.yaml", "#/")
+        with patch("pathlib.Path.resolve") as mock_resolve:
+            self.cache.get_schema("schema.yaml", "#/")
+            mock_resolve.assert_not_called()
+
     def test_absolute_path_handling(self):
         """Test that absolute paths work correctly."""
         schema_file = self.temp_path / "schema.yaml"
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import io
+import logging
+import sys
+
+import pytest
+
+from teds_core import report
+from teds_core.cache import SchemaCacheError, TedsSchemaCache
+from teds_core.cli import (
+    VerifyCommand,
+    _build_parser,
+    _fast_parse_generate,
+    _fast_parse_verify,
+    _redirect_log_streams,
+    main,
+    setup_logging,
+)
+from teds_core.errors import TedsError
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["verify", "a.yaml"],
+        ["verify", "a.yaml", "b.yaml"],
+        ["verify", "-l", "all", "a.yaml"],
+        ["verify", "a.yaml", "-l", "error"],
+        ["verify", "--output-level=all", "a.yaml"],
+        ["verify", "-lall", "a.yaml"],
+        ["verify", "-i", "a.yaml", "b.yaml"],
+        ["verify", "--report", "summary.md", "a.yaml"],
+        ["verify", "--report=summary.md=out.md", "a.yaml"],
+    ],
+)
+def test_fast_verify_parse_matches_argparse(argv):
+    assert _fast_parse_verify(argv) == _build_parser("verify").parse_args(argv)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["verify"],
+        ["verify", "-h"],
+        ["verify", "--in", "a.yaml"],
+        ["verify", "-il", "all", "a.yaml"],
+        ["verify", "-l", "bogus", "a.yaml"],
+        ["verify", "a.yaml", "-l", "all", "b.yaml"],
+        ["verify", "a.yaml", "--report"],
+    ],
+)
+def test_fast_verify_parse_defers_to_argparse(argv):
+    assert _fast_parse_verify(argv) is None
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["generate", "schema.yaml#/$defs"],
+        ["generate", "a.yaml#/x", "b.yaml=out/{base}.tests.yaml"],
+    ],
+)
+def test_fast_generate_parse_matches_argparse(argv):
+    assert _fast_parse_generate(argv) == _build_parser("generate").parse_args(argv)
+
+
+@pytest.mark.parametrize(
+    "argv", [["generate"], ["generate", "-h"], ["generate", "a", "-x"]]
+)
+def test_fast_generate_parse_defers_to_argparse(argv):
+    assert _fast_parse_generate(argv) is None
+
+
+def test_report_mode_prints_teds_errors_without_traceback(monkeypatch, capsys):
+    def fail(*_args):
+        raise TedsError("cache unusable")
+
+    monkeypatch.setattr(report, "run_report_per_spec", fail)
+    args = _build_parser("verify").parse_args(
+        ["verify", "--report", "summary.md", "a.yaml"]
+    )
+
+    assert VerifyCommand()._handle_report_mode(args) == 2
+    err = capsys.readouterr().err
+    assert err == "cache unusable\n"
+
+
+def test_shared_cache_save_error_is_reported_as_cache_error(
+    tmp_path, monkeypatch, capsys
+):
+    spec = tmp_path / "spec.yaml"
+    spec.write_text('version: "1.0.0"\ntests: {}\n')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["teds", "verify", str(spec)])
+
+    def fail(_self):
+        raise SchemaCacheError("Failed to save cache: disk full")
+
+    monkeypatch.setattr(TedsSchemaCache, "save", fail)
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert "Schema cache error: Failed to save cache: disk full" in err
+    assert "Error parsing arguments" not in err
+
+
+@pytest.fixture
+def verify_specs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    schema = tmp_path / "schema.yaml"
+    schema.write_text(
+        "definitions:\n  Id: {type: integer}\n  Name: {type: string}\n",
+        encoding="utf-8",
+    )
+    specs = []
+    for name, pointer, payload in [
+        ("a", "Id", "1"),
+        ("b", "Name", "1"),  # Fails: an integer is not a Name
+        ("c", "Id", "2"),
+    ]:
+        spec = tmp_path / f"{name}.yaml"
+        spec.write_text(
+            f'version: "1.0.0"\ntests:\n  schema.yaml#/definitions/{pointer}:\n'
+            f"    valid:\n      case1:\n        payload: {payload}\n",
+            encoding="utf-8",
+        )
+        specs.append(str(spec))
+    return specs
+
+
+def _run_verify(specs, capsys, verify):
+    """Run ``verify`` on a fresh shared cache; return rc, output and pointers."""
+    for name in (TedsSchemaCache.CACHE_FILENAME, TedsSchemaCache.JOURNAL_FILENAME):
+        (TedsSchemaCache().project_root / name).unlink(missing_ok=True)
+    args = _build_parser("verify").parse_args(["verify", *specs])
+    with TedsSchemaCache() as args.cache:
+        rc = verify(args)
+    pointers = {
+        key: dict(entry["pointers"])
+        for key, entry in args.cache.cache_data["entries"].items()
+    }
+    return rc, capsys.readouterr(), pointers
+
+
+def test_parallel_verify_matches_serial_run(verify_specs, capsys):
+    serial = _run_verify(verify_specs, capsys, VerifyCommand()._handle_verify_mode)
+    parallel = _run_verify(
+        verify_specs,
+        capsys,
+        lambda args: VerifyCommand()._verify_in_parallel(args, workers=2),
+    )
+
+    assert serial[0] == 1
+    assert serial[1].err.index("a.yaml") < serial[1].err.index("c.yaml")
+    assert parallel == serial
+
+
+def test_small_verify_runs_stay_serial(verify_specs, monkeypatch, capsys):
+    def fail(*_args, **_kwargs):
+        raise AssertionError("worker pool started")
+
+    monkeypatch.setattr(VerifyCommand, "_verify_in_parallel", fail)
+    rc, _, pointers = _run_verify(
+        verify_specs, capsys, VerifyCommand()._handle_verify_mode
+    )
+
+    assert rc == 1
+    assert pointers
+
+
+def test_redirect_log_streams_captures_console_handlers():
+    logger = logging.getLogger("teds_core")
+    console = io.StringIO()
+    handler = logging.StreamHandler(console)
+    logger.addHandler(handler)
+    captured = io.StringIO()
+    try:
+        with _redirect_log_streams(captured):
+            logger.warning("inside")
+        logger.warning("outside")
+    finally:
+        logger.removeHandler(handler)
+
+    assert "inside" in captured.getvalue()
+    assert console.getvalue() == "outside\n"
+
+
+@pytest.mark.parametrize(
+    ("env_level", "level"),
+    [
+        ("warn", logging.WARNING),
+        ("FATAL", logging.CRITICAL),
+        ("debug", logging.DEBUG),
+        ("bogus", logging.INFO),
+    ],
+)
+def test_loglevel_env_accepts_logging_level_names(env_level, level, monkeypatch):
+    monkeypatch.setenv("LOGLEVEL", env_level)
+    logger = logging.getLogger("teds_core")
+    monkeypatch.setattr(logger, "level", logger.level)
+
+    setup_logging.__wrapped__()
+
+    assert logger.level == level
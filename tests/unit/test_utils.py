@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 from jsonpath_ng import parse
 
-from teds_core.utils import json_path_to_json_pointer
+from teds_core.utils import expand_target_template, json_path_to_json_pointer
 
 
 @pytest.mark.parametrize(
@@ -63,6 +63,14 @@ def test_json_path_to_json_pointer_unhandled_type():
         json_path_to_json_pointer(None)
 
 
+def test_expand_target_template_single_pass():
+    expanded = expand_target_template(
+        "{dir}/{base}.{pointer}.{unknown}.{ext}", "schemas/{ext}.yaml", "/a/b"
+    )
+    # Substituted values are not expanded again, unknown tokens stay literal
+    assert expanded == "schemas/{ext}.a~1b.{unknown}.yaml"
+
+
 # CLI runner (used by CLI tests)
 _SCRIPT = Path(__file__).resolve().parents[1] / "teds.py"
 
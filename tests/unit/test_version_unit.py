@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from teds_core.version import (
     check_spec_compat,
+    get_version,
     recommended_minor_str,
     supported_spec_range_str,
 )
@@ -16,3 +19,14 @@ def test_supported_and_recommended_strings():
     s = supported_spec_range_str()
     r = recommended_minor_str()
     assert "." in s and "." in r
+
+
+def test_get_version_is_resolved_once():
+    get_version.cache_clear()
+    try:
+        with patch("teds_core.version._from_pkg", return_value="9.9.9") as from_pkg:
+            assert get_version() == "9.9.9"
+            assert get_version() == "9.9.9"
+        assert from_pkg.call_count == 1
+    finally:
+        get_version.cache_clear()